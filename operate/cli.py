@@ -86,6 +86,8 @@ class OperateApp:
             logger=self.logger,
         )
         self.password: t.Optional[str] = os.environ.get("OPERATE_USER_PASSWORD")
+        self._service_manager: t.Optional[services.manage.ServiceManager] = None
+        self._service_manager_password: t.Optional[str] = None
 
     def create_user_account(self, password: str) -> UserAccount:
         """Create a user account."""
@@ -97,12 +99,21 @@ class OperateApp:
 
     def service_manager(self) -> services.manage.ServiceManager:  # type: ignore
         """Load service manager."""
-        return services.manage.ServiceManager(  # type: ignore
-            path=self._services,
-            keys_manager=self.keys_manager,
-            wallet_manager=self.wallet_manager,
-            logger=self.logger,
-        )
+        # Rebuild on password change so cached wallets are never reused
+        if (
+            self._service_manager is None
+            or self._service_manager_password != self.password
+        ):
+            if self._service_manager is not None:
+                self._service_manager.close()
+            self._service_manager = services.manage.ServiceManager(  # type: ignore
+                path=self._services,
+                keys_manager=self.keys_manager,
+                wallet_manager=self.wallet_manager,
+                logger=self.logger,
+            )
+            self._service_manager_password = self.password
+        return self._service_manager
 
     @property
     def user_account(self) -> t.Optional[UserAccount]:
@@ -560,7 +571,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
     @with_retries
     async def _get_services(request: Request) -> JSONResponse:
         """Get available services."""
-        return JSONResponse(content=operate.service_manager().json)
+        return JSONResponse(content=list(operate.service_manager().iter_services()))
 
     @app.post("/api/services")
     @with_retries
@@ -675,13 +686,7 @@ def create_app(  # pylint: disable=too-many-locals, unused-argument, too-many-st
             return service_not_found_error(service=request.path_params["service"])
         if operate.password is None:
             return USER_NOT_LOGGED_IN_ERROR
-        operate.service_manager().terminate_service_on_chain(
-            hash=request.path_params["service"]
-        )
-        operate.service_manager().unbond_service_on_chain(
-            hash=request.path_params["service"]
-        )
-        operate.service_manager().unstake_service_on_chain(
+        operate.service_manager().stop_service_on_chain(
             hash=request.path_params["service"]
         )
         return JSONResponse(
@@ -29,9 +29,20 @@ CONFIG = "config.json"
 KEY = "key"
 KEYS = "keys"
 KEYS_JSON = "keys.json"
+STATE_JSON = "state.json"
 DOCKER_COMPOSE_YAML = "docker-compose.yaml"
 SERVICE_YAML = "service.yaml"
 
 ON_CHAIN_INTERACT_TIMEOUT = 120.0
 ON_CHAIN_INTERACT_RETRIES = 40
 ON_CHAIN_INTERACT_SLEEP = 3.0
+# Receipt polling backoff
+ON_CHAIN_RECEIPT_POLL_INITIAL = 0.5
+ON_CHAIN_RECEIPT_POLL_MAX = 8.0
+ON_CHAIN_RECEIPT_POLL_FACTOR = 1.5
+
+RPC_BATCH_SIZE = 50
+RPC_REQUEST_TIMEOUT = 30.0
+RPC_POOL_SIZE = 32
+RPC_PING_INTERVAL = 60.0
+RPC_PING_TIMEOUT = 3.0
@@ -83,23 +83,24 @@ class KeysManager:
 
     def create(self) -> str:
         """Creates new key."""
-        crypto = EthereumCrypto()
-        path = self.path / crypto.address
-        if path.is_file():
-            return crypto.address
-
-        path.write_text(
-            json.dumps(
-                Key(
-                    ledger=LedgerType.ETHEREUM,
-                    address=crypto.address,
-                    private_key=crypto.private_key,
-                ).json,
-                indent=4,
-            ),
-            encoding="utf-8",
-        )
-        return crypto.address
+        (key,) = self.create_many(n=1)
+        return key.address
+
+    def create_many(self, n: int) -> t.List[Key]:
+        """Creates `n` new keys and returns the key objects."""
+        keys = []
+        for _ in range(n):
+            crypto = EthereumCrypto()
+            key = Key(
+                ledger=LedgerType.ETHEREUM,
+                address=crypto.address,
+                private_key=crypto.private_key,
+            )
+            path = self.path / crypto.address
+            if not path.is_file():
+                path.write_text(json.dumps(key.json, indent=4), encoding="utf-8")
+            keys.append(key)
+        return keys
 
     def delete(self, key: str) -> None:
         """Delete key."""
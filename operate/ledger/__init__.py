@@ -22,8 +22,11 @@
 import os
 import typing as t
 
+from web3.providers.base import JSONBaseProvider
+
 from operate.ledger.base import LedgerHelper
 from operate.ledger.ethereum import Ethereum
+from operate.ledger.http import PersistentHTTPProvider, RPCLoadBalancer
 from operate.ledger.solana import Solana
 from operate.types import ChainType, LedgerType
 
@@ -48,14 +51,43 @@ PUBLIC_RPCS = {
     ChainType.SOLANA: SOLANA_PUBLIC_RPC,
 }
 
-DEFAULT_RPCS = {
-    ChainType.ETHEREUM: ETHEREUM_RPC,
-    ChainType.GNOSIS: GNOSIS_RPC,
-    ChainType.GOERLI: GOERLI_RPC,
-    ChainType.SOLANA: SOLANA_RPC,
-    ChainType.OPTIMISM: OPTIMISM_RPC,
-    ChainType.BASE: BASE_RPC,
-    ChainType.CELO: CELO_RPC,
+
+def _with_fallbacks(rpc: str, env: str, *fallbacks: str) -> t.Tuple[str, ...]:
+    """RPC followed by public fallbacks, unless it is overridden with `env`."""
+    return (rpc,) if env in os.environ else (rpc, *fallbacks)
+
+
+# The first endpoint of each chain is the primary one
+DEFAULT_RPCS: t.Dict[ChainType, t.Tuple[str, ...]] = {
+    ChainType.ETHEREUM: _with_fallbacks(
+        ETHEREUM_RPC,
+        "ETHEREUM_RPC",
+        "https://eth.llamarpc.com",
+        "https://rpc.ankr.com/eth",
+    ),
+    ChainType.GNOSIS: _with_fallbacks(
+        GNOSIS_RPC,
+        "DEV_RPC",
+        "https://gnosis-rpc.publicnode.com",
+        "https://rpc.gnosischain.com",
+    ),
+    ChainType.GOERLI: (GOERLI_RPC,),
+    ChainType.SOLANA: (SOLANA_RPC,),
+    ChainType.OPTIMISM: _with_fallbacks(
+        OPTIMISM_RPC,
+        "OPTIMISM_RPC",
+        "https://mainnet.optimism.io",
+    ),
+    ChainType.BASE: _with_fallbacks(
+        BASE_RPC,
+        "BASE_RPC",
+        "https://mainnet.base.org",
+    ),
+    ChainType.CELO: _with_fallbacks(
+        CELO_RPC,
+        "CELO_RPC",
+        "https://rpc.ankr.com/celo",
+    ),
 }
 
 CHAIN_HELPERS: t.Dict[ChainType, t.Type[LedgerHelper]] = {
@@ -81,10 +113,20 @@ CURRENCY_DENOMS = {
     ChainType.CELO: "CELO",
 }
 
+# Lookup tables indexed by `ChainType` value, missing chains use the defaults
+_RPCS_BY_CHAIN = tuple(DEFAULT_RPCS.get(chain, (ETHEREUM_RPC,)) for chain in ChainType)
+_HELPER_BY_CHAIN = tuple(CHAIN_HELPERS.get(chain, Ethereum) for chain in ChainType)
+_DENOM_BY_CHAIN = tuple(CURRENCY_DENOMS.get(chain, "Wei") for chain in ChainType)
+
 
 def get_default_rpc(chain: ChainType) -> str:
     """Get default RPC chain type."""
-    return DEFAULT_RPCS.get(chain, ETHEREUM_RPC)
+    return _RPCS_BY_CHAIN[chain][0]
+
+
+def get_ws_rpc(chain: ChainType) -> t.Optional[str]:
+    """Get the WebSocket RPC for events on a chain type, if one is configured."""
+    return os.environ.get(f"{chain.name}_WS_RPC")
 
 
 def get_ledger_type_from_chain_type(chain: ChainType) -> LedgerType:
@@ -94,9 +136,36 @@ def get_ledger_type_from_chain_type(chain: ChainType) -> LedgerType:
     return LedgerType.SOLANA
 
 
+_RPC_LOAD_BALANCERS: t.Dict[ChainType, RPCLoadBalancer] = {}
+
+
+def get_rpc_provider(rpc: str, chain: ChainType) -> JSONBaseProvider:
+    """
+    Get the HTTP provider for an RPC
+
+    The default RPC of a chain is spread over its fallbacks by a load balancer
+    shared by all the callers, a custom RPC is used as is.
+    """
+    endpoints = _RPCS_BY_CHAIN[chain]
+    if len(endpoints) == 1 or rpc != endpoints[0]:
+        return PersistentHTTPProvider(endpoint_uri=rpc)
+    if chain not in _RPC_LOAD_BALANCERS:
+        _RPC_LOAD_BALANCERS[chain] = RPCLoadBalancer(endpoints=endpoints)
+    return _RPC_LOAD_BALANCERS[chain]
+
+
+_LEDGER_HELPERS_BY_CHAIN: t.Dict[t.Tuple[str, ChainType], LedgerHelper] = {}
+
+
 def get_ledger_helper_by_chain(rpc: str, chain: ChainType) -> LedgerHelper:
     """Get ledger helper by chain type."""
-    return CHAIN_HELPERS.get(chain, Ethereum)(rpc=rpc)
+    key = (rpc, chain)
+    if key not in _LEDGER_HELPERS_BY_CHAIN:
+        helper = _HELPER_BY_CHAIN[chain](rpc=rpc)
+        if isinstance(helper, Ethereum):
+            helper.api.api.provider = get_rpc_provider(rpc=rpc, chain=chain)
+        _LEDGER_HELPERS_BY_CHAIN[key] = helper
+    return _LEDGER_HELPERS_BY_CHAIN[key]
 
 
 def get_ledger_helper_by_ledger(rpc: str, ledger: LedgerHelper) -> LedgerHelper:
@@ -106,4 +175,4 @@ def get_ledger_helper_by_ledger(rpc: str, ledger: LedgerHelper) -> LedgerHelper:
 
 def get_currency_denom(chain: ChainType) -> str:
     """Get currency denom by chain type."""
-    return CURRENCY_DENOMS.get(chain, "Wei")
+    return _DENOM_BY_CHAIN[chain]
@@ -24,6 +24,7 @@ import typing as t
 from aea_ledger_ethereum import EthereumApi, EthereumCrypto
 
 from operate.ledger.base import LedgerHelper
+from operate.ledger.http import use_persistent_session
 from operate.types import LedgerType
 
 
@@ -36,6 +37,7 @@ class Ethereum(LedgerHelper):
         """Initialize object."""
         super().__init__(rpc)
         self.api = EthereumApi(address=self.rpc)
+        use_persistent_session(web3=self.api.api, rpc=self.rpc)
 
     def create_key(self) -> t.Dict:
         """Create key."""
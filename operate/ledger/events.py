@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""On-chain event subscriptions."""
+
+import asyncio
+import json
+import logging
+import threading
+import typing as t
+
+import aiohttp
+from aea.helpers.logging import setup_logger
+from web3 import Web3
+
+from operate.types import OnChainState
+
+
+RECONNECT_DELAY = 5.0
+
+# ServiceRegistry events and the service state they lead to
+SERVICE_STATE_EVENTS = {
+    "CreateService(uint256,bytes32)": OnChainState.PRE_REGISTRATION,
+    "ActivateRegistration(uint256)": OnChainState.ACTIVE_REGISTRATION,
+    "DeployService(uint256)": OnChainState.DEPLOYED,
+}
+
+LogCallback = t.Callable[[t.Dict], None]
+
+
+class EventSubscriber:
+    """Follow contract logs with a WebSocket `eth_subscribe` subscription."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        rpc: str,
+        address: str,
+        topics: t.List[t.Any],
+        callback: LogCallback,
+        on_connect: t.Optional[t.Callable[[], None]] = None,
+        logger: t.Optional[logging.Logger] = None,
+    ) -> None:
+        """
+        Initialize the subscriber
+
+        :param rpc: WebSocket RPC endpoint.
+        :param address: Address of the contract emitting the logs.
+        :param topics: Topic filter for the logs.
+        :param callback: Called with every received log object.
+        :param on_connect: Called every time the subscription is (re)established,
+            logs emitted while disconnected are not replayed.
+        :param logger: logging.Logger object.
+        """
+        self.rpc = rpc
+        self.address = address
+        self.topics = topics
+        self.callback = callback
+        self.on_connect = on_connect
+        self.logger = logger or setup_logger(name="operate.events")
+        self.connected = False
+        self._stopped = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the subscription thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "EventSubscriber":
+        """Start following the logs in a background thread."""
+        if not self.running:
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=lambda: asyncio.run(self._run()),
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop following the logs."""
+        self._stopped.set()
+
+    async def _run(self) -> None:
+        """Keep the subscription alive until stopped."""
+        while not self._stopped.is_set():
+            try:
+                await self._subscribe()
+            except Exception as e:  # pylint: disable=broad-except
+                self.logger.warning(f"Event subscription to {self.rpc} failed: {e}")
+            finally:
+                self.connected = False
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _subscribe(self) -> None:
+        """Subscribe and dispatch the received logs."""
+        async with aiohttp.ClientSession() as session, session.ws_connect(
+            self.rpc, heartbeat=30.0
+        ) as ws:
+            await ws.send_json(
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "eth_subscribe",
+                    "params": [
+                        "logs",
+                        {"address": self.address, "topics": self.topics},
+                    ],
+                }
+            )
+            while not self._stopped.is_set():
+                try:
+                    message = await ws.receive(timeout=1.0)
+                except asyncio.TimeoutError:
+                    continue
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    raise ValueError(f"Subscription closed: {message.type.name}")
+                data = json.loads(message.data)
+                if "error" in data:
+                    raise ValueError(f"Subscription failed: {data['error']}")
+                if data.get("id") == 1:
+                    if self.on_connect is not None:
+                        self.on_connect()
+                    self.connected = True
+                elif data.get("method") == "eth_subscription":
+                    self.callback(data["params"]["result"])
+
+
+def service_state_subscriber(
+    rpc: str,
+    service_registry: str,
+    on_state: t.Callable[[int, OnChainState], None],
+    on_connect: t.Optional[t.Callable[[], None]] = None,
+    logger: t.Optional[logging.Logger] = None,
+) -> EventSubscriber:
+    """
+    Create a subscriber following the service state changes on a ServiceRegistry
+
+    :param rpc: WebSocket RPC endpoint.
+    :param service_registry: Service registry address.
+    :param on_state: Called with the service id and its new state.
+    :param on_connect: Called every time the subscription is (re)established.
+    :param logger: logging.Logger object.
+    :return: Event subscriber, not started yet.
+    """
+    states = {
+        Web3.keccak(text=event).hex(): state
+        for event, state in SERVICE_STATE_EVENTS.items()
+    }
+
+    def _callback(log: t.Dict) -> None:
+        topic, service_id, *_ = log["topics"]
+        if log.get("removed", False) or topic not in states:
+            return
+        on_state(int(service_id, 16), states[topic])
+
+    return EventSubscriber(
+        rpc=rpc,
+        address=service_registry,
+        topics=[list(states)],
+        callback=_callback,
+        on_connect=on_connect,
+        logger=logger,
+    )
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""HTTP providers for RPC calls."""
+
+import enum
+import math
+import threading
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import HTTPProvider, Web3
+from web3.providers.base import JSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from operate.constants import (
+    RPC_PING_INTERVAL,
+    RPC_PING_TIMEOUT,
+    RPC_POOL_SIZE,
+    RPC_REQUEST_TIMEOUT,
+)
+
+
+# Errors meaning the endpoint did not answer with a JSON-RPC response, an
+# invalid body fails to decode with a `ValueError`
+TRANSPORT_ERRORS = (requests.RequestException, ValueError)
+
+# Methods which must keep hitting the same endpoint, a nonce read from one
+# endpoint can be behind a transaction sent through another
+FAILOVER_METHODS = frozenset(("eth_getTransactionCount", "eth_sendRawTransaction"))
+
+
+def _make_session() -> requests.Session:
+    """Create a keep-alive session with a connection pool per RPC host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=RPC_POOL_SIZE, pool_maxsize=RPC_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+HTTP_SESSION = _make_session()
+
+
+class PersistentHTTPProvider(HTTPProvider):
+    """HTTP provider which sends every request through `HTTP_SESSION`."""
+
+    def make_request(self, method: RPCEndpoint, params: t.Any) -> RPCResponse:
+        """Make an RPC request."""
+        self.logger.debug(
+            f"Making request HTTP. URI: {self.endpoint_uri}, Method: {method}"
+        )
+        kwargs = {"timeout": RPC_REQUEST_TIMEOUT, **dict(self.get_request_kwargs())}
+        response = HTTP_SESSION.post(
+            self.endpoint_uri,
+            data=self.encode_rpc_request(method, params),
+            **kwargs,
+        )
+        response.raise_for_status()
+        return self.decode_rpc_response(response.content)
+
+
+class RPCStrategy(enum.Enum):
+    """Endpoint selection strategy."""
+
+    FASTEST = "fastest"
+    ROUND_ROBIN = "round_robin"
+    FAILOVER = "failover"
+
+
+class RPCLoadBalancer(JSONBaseProvider):
+    """
+    Provider spreading requests over several RPC endpoints
+
+    Endpoints are tried in the order given by the strategy and a request which
+    fails at the transport level (connection error, timeout, rate limit) is
+    retried on the next endpoint. JSON-RPC errors such as reverts are returned
+    as they are. Nonce reads and transaction submissions always use the
+    failover order.
+    """
+
+    def __init__(
+        self,
+        endpoints: t.Sequence[str],
+        strategy: RPCStrategy = RPCStrategy.FASTEST,
+        ping_interval: float = RPC_PING_INTERVAL,
+    ) -> None:
+        """
+        Initialize the provider
+
+        :param endpoints: RPC endpoints, in order of preference.
+        :param strategy: Endpoint selection strategy.
+        :param ping_interval: How often the endpoint latencies are re-measured
+            with `eth_blockNumber`, in a background thread. The `fastest`
+            strategy orders by them, all strategies try failing endpoints last.
+        """
+        super().__init__()
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required")
+        self.providers = [
+            PersistentHTTPProvider(endpoint_uri=endpoint) for endpoint in endpoints
+        ]
+        self._ping_providers = [
+            PersistentHTTPProvider(
+                endpoint_uri=endpoint,
+                request_kwargs={"timeout": RPC_PING_TIMEOUT},
+            )
+            for endpoint in endpoints
+        ]
+        self.strategy = strategy
+        self.ping_interval = ping_interval
+        self._latencies = [0.0] * len(self.providers)
+        self._last_ping = -math.inf
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _ping_due(self) -> bool:
+        """Whether the latencies are stale, the caller getting `True` pings."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_ping <= self.ping_interval:
+                return False
+            # Concurrent callers keep using the previous latencies meanwhile
+            self._last_ping = now
+            return True
+
+    def _ping_one(self, idx: int) -> None:
+        """Measure the `eth_blockNumber` latency of an endpoint."""
+        start = time.perf_counter()
+        try:
+            response = self._ping_providers[idx].make_request(
+                RPCEndpoint("eth_blockNumber"), []
+            )
+        except TRANSPORT_ERRORS:
+            self._latencies[idx] = math.inf
+            return
+        self._latencies[idx] = (
+            math.inf if "error" in response else time.perf_counter() - start
+        )
+
+    def _ping(self) -> None:
+        """Measure the latencies of all the endpoints concurrently."""
+        with ThreadPoolExecutor(max_workers=len(self._ping_providers)) as executor:
+            list(executor.map(self._ping_one, range(len(self._ping_providers))))
+
+    def _failover_order(self) -> t.List[int]:
+        """Endpoints in order of preference, the failing ones last."""
+        return sorted(
+            range(len(self.providers)),
+            key=lambda idx: self._latencies[idx] == math.inf,
+        )
+
+    def _order(self, method: t.Optional[str] = None) -> t.List[int]:
+        """Endpoint indexes in the order they should be tried."""
+        if self._ping_due():
+            threading.Thread(target=self._ping, daemon=True).start()
+        if method in FAILOVER_METHODS or self.strategy == RPCStrategy.FAILOVER:
+            return self._failover_order()
+        indexes = list(range(len(self.providers)))
+        if self.strategy == RPCStrategy.ROUND_ROBIN:
+            with self._lock:
+                start, self._next = self._next, (self._next + 1) % len(indexes)
+            return indexes[start:] + indexes[:start]
+        return sorted(indexes, key=lambda idx: self._latencies[idx])
+
+    def make_request(self, method: RPCEndpoint, params: t.Any) -> RPCResponse:
+        """Make an RPC request, failing over to the next endpoint on errors."""
+        error: t.Optional[Exception] = None
+        for idx in self._order(method=method):
+            try:
+                return self.providers[idx].make_request(method, params)
+            except TRANSPORT_ERRORS as e:
+                # Deprioritise the endpoint until the next ping
+                self._latencies[idx] = math.inf
+                error = e
+        raise t.cast(Exception, error)
+
+    def is_connected(self, show_traceback: bool = False) -> bool:
+        """Whether any of the endpoints is reachable."""
+        return any(
+            provider.is_connected(show_traceback=show_traceback)
+            for provider in self.providers
+        )
+
+
+def use_persistent_session(web3: Web3, rpc: str) -> Web3:
+    """Point a `Web3` instance at `rpc` through the shared HTTP session."""
+    web3.provider = PersistentHTTPProvider(endpoint_uri=rpc)
+    return web3
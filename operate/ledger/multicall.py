@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Multicall3 helpers."""
+
+import typing as t
+
+from aea.crypto.base import LedgerApi
+from eth_utils.abi import collapse_if_tuple
+from hexbytes import HexBytes
+from web3.contract import Contract
+
+from operate.ledger.rpc import a_request
+
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {"internalType": "bool", "name": "requireSuccess", "type": "bool"},
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call[]",
+                "name": "calls",
+                "type": "tuple[]",
+            },
+        ],
+        "name": "tryAggregate",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    }
+]
+
+
+class MulticallBatcher:
+    """Batch contract reads into a single Multicall3 `eth_call`."""
+
+    def __init__(
+        self,
+        ledger_api: LedgerApi,
+        address: str = MULTICALL3_ADDRESS,
+    ) -> None:
+        """
+        Initialize the batcher
+
+        :param ledger_api: Ledger API object.
+        :param address: Multicall3 contract address.
+        """
+        self.ledger_api = ledger_api
+        self.address = address
+        self._calls: t.List[t.Tuple[str, bytes, t.List[str], str]] = []
+
+    def add(
+        self,
+        contract: Contract,
+        fn_name: str,
+        args: t.Optional[t.Sequence[t.Any]] = None,
+    ) -> "MulticallBatcher":
+        """Queue a contract read."""
+        (fn_abi,) = (
+            item
+            for item in contract.abi
+            if item.get("type") == "function" and item.get("name") == fn_name
+        )
+        calldata = contract.encodeABI(fn_name=fn_name, args=list(args or []))
+        self._calls.append(
+            (
+                contract.address,
+                HexBytes(calldata),
+                [collapse_if_tuple(output) for output in fn_abi["outputs"]],
+                fn_name,
+            )
+        )
+        return self
+
+    def _decode(
+        self,
+        results: t.Sequence[t.Tuple[bool, bytes]],
+        allow_failure: bool,
+    ) -> t.List[t.Any]:
+        """Decode `tryAggregate` results."""
+        decoded = []
+        for (target, _, output_types, fn_name), (success, return_data) in zip(
+            self._calls, results
+        ):
+            if not success:
+                if not allow_failure:
+                    raise ValueError(f"Multicall to `{fn_name}` on {target} reverted")
+                decoded.append(None)
+                continue
+            values = self.ledger_api.api.codec.decode(output_types, bytes(return_data))
+            decoded.append(values[0] if len(values) == 1 else tuple(values))
+        return decoded
+
+    @property
+    def _instance(self) -> Contract:
+        """Multicall3 contract instance."""
+        return self.ledger_api.api.eth.contract(
+            address=self.address,
+            abi=MULTICALL3_ABI,
+        )
+
+    @property
+    def _aggregate_args(self) -> t.List[t.Any]:
+        """Arguments for `tryAggregate`."""
+        return [False, [(target, calldata) for target, calldata, *_ in self._calls]]
+
+    def call(self, allow_failure: bool = False) -> t.List[t.Any]:
+        """
+        Execute the queued reads in one `tryAggregate` call
+
+        Results are returned in the order the calls were added. Single output
+        functions are unwrapped the same way `web3` does for `.call()`.
+
+        :param allow_failure: Return `None` for reverted calls instead of raising.
+        :return: List of decoded results.
+        """
+        if not self._calls:
+            return []
+
+        results = self._instance.functions.tryAggregate(*self._aggregate_args).call()
+        return self._decode(results=results, allow_failure=allow_failure)
+
+    async def a_call(self, rpc: str, allow_failure: bool = False) -> t.List[t.Any]:
+        """Async version of `call`, sends the `eth_call` to `rpc` using `aiohttp`."""
+        if not self._calls:
+            return []
+
+        data = self._instance.encodeABI(
+            fn_name="tryAggregate",
+            args=self._aggregate_args,
+        )
+        result = await a_request(
+            rpc=rpc,
+            method="eth_call",
+            params=[{"to": self.address, "data": data}, "latest"],
+        )
+        (results,) = self.ledger_api.api.codec.decode(
+            ["(bool,bytes)[]"], HexBytes(result)
+        )
+        return self._decode(results=results, allow_failure=allow_failure)
@@ -0,0 +1,337 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""JSON-RPC batch helpers."""
+
+import time
+import typing as t
+
+import aiohttp
+from eth_utils import keccak
+
+from operate.constants import (
+    ON_CHAIN_INTERACT_TIMEOUT,
+    ON_CHAIN_RECEIPT_POLL_FACTOR,
+    ON_CHAIN_RECEIPT_POLL_INITIAL,
+    ON_CHAIN_RECEIPT_POLL_MAX,
+    RPC_BATCH_SIZE,
+    RPC_REQUEST_TIMEOUT,
+)
+from operate.ledger.http import HTTP_SESSION, TRANSPORT_ERRORS
+
+
+RPCCall = t.Tuple[str, t.List[t.Any]]
+
+ERC20_BALANCE_OF_SELECTOR = "0x70a08231"
+
+
+class RPCError(ValueError):
+    """The endpoint answered a JSON-RPC call with an error."""
+
+
+def _payload(calls: t.Sequence[RPCCall], offset: int = 0) -> t.List[t.Dict]:
+    """Build a JSON-RPC 2.0 batch payload."""
+    return [
+        {"jsonrpc": "2.0", "id": offset + idx, "method": method, "params": params}
+        for idx, (method, params) in enumerate(calls)
+    ]
+
+
+def _results(responses: t.Any, ids: t.Iterable[int]) -> t.List[t.Any]:
+    """Match batch responses back to request ids."""
+    if not isinstance(responses, list):
+        raise ValueError(f"Invalid JSON-RPC batch response: {responses}")
+    by_id = {response.get("id"): response for response in responses}
+    results = []
+    for idx in ids:
+        response = by_id.get(idx)
+        if response is None:
+            raise ValueError(f"Missing JSON-RPC response for request {idx}")
+        if "error" in response:
+            raise RPCError(f"JSON-RPC request {idx} failed: {response['error']}")
+        results.append(response.get("result"))
+    return results
+
+
+def batch_request(
+    rpc: str,
+    calls: t.Sequence[RPCCall],
+    batch_size: int = RPC_BATCH_SIZE,
+) -> t.List[t.Any]:
+    """
+    Send JSON-RPC calls as batch requests
+
+    Calls are chunked into batches of `batch_size` and the results are
+    returned in the same order as `calls`. When an endpoint does not answer
+    a batch with a list of responses, the calls of that batch are retried
+    one by one.
+
+    :param rpc: RPC endpoint.
+    :param calls: List of `(method, params)` tuples.
+    :param batch_size: Maximum number of calls per HTTP request.
+    :return: List of results.
+    """
+    results: t.List[t.Any] = []
+    for offset in range(0, len(calls), batch_size):
+        chunk = calls[offset : offset + batch_size]
+        payload = _payload(calls=chunk, offset=offset)
+        response = HTTP_SESSION.post(rpc, json=payload, timeout=RPC_REQUEST_TIMEOUT)
+        response.raise_for_status()
+        responses = response.json()
+        if not isinstance(responses, list):
+            # Batches are not supported by the endpoint
+            results += [
+                request(rpc=rpc, method=method, params=params)
+                for method, params in chunk
+            ]
+            continue
+        results += _results(
+            responses=responses,
+            ids=(call["id"] for call in payload),
+        )
+    return results
+
+
+def request(rpc: str, method: str, params: t.List[t.Any]) -> t.Any:
+    """Send a single JSON-RPC call."""
+    (payload,) = _payload(calls=[(method, params)])
+    response = HTTP_SESSION.post(rpc, json=payload, timeout=RPC_REQUEST_TIMEOUT)
+    response.raise_for_status()
+    (result,) = _results(responses=[response.json()], ids=[payload["id"]])
+    return result
+
+
+def get_balances(
+    rpc: str,
+    addresses: t.Sequence[str],
+    batch_size: int = RPC_BATCH_SIZE,
+) -> t.List[int]:
+    """Get native balances for a list of addresses."""
+    return [
+        int(balance, 16)
+        for balance in batch_request(
+            rpc=rpc,
+            calls=[("eth_getBalance", [address, "latest"]) for address in addresses],
+            batch_size=batch_size,
+        )
+    ]
+
+
+def _is_known(rpc: str, tx_hash: str) -> t.Optional[bool]:
+    """Check whether the endpoint knows a transaction, `None` if the check fails."""
+    try:
+        return (
+            request(rpc=rpc, method="eth_getTransactionByHash", params=[tx_hash])
+            is not None
+        )
+    except TRANSPORT_ERRORS:
+        return None
+
+
+def send_raw_transactions(
+    rpc: str,
+    raw_transactions: t.Sequence[str],
+) -> t.Tuple[t.List[str], t.Optional[Exception]]:
+    """
+    Submit signed transactions one by one, without waiting for their receipts
+
+    The hashes are computed locally. When a submission fails the endpoint is
+    asked whether it knows the transaction. Only a transaction which is
+    rejected with a JSON-RPC error and unknown to the endpoint is left out
+    of the returned hashes, a transaction whose fate is unclear is returned
+    for its receipt to decide. Submission stops at the first transaction
+    which is not known to be accepted, the ones after it would be stuck
+    behind the nonce gap.
+
+    :param rpc: RPC endpoint.
+    :param raw_transactions: Signed transactions, in nonce order.
+    :return: Hashes of the submitted transactions and the submission error, if any.
+    """
+    tx_hashes: t.List[str] = []
+    for raw_tx in raw_transactions:
+        tx_hash = "0x" + keccak(hexstr=raw_tx).hex()
+        try:
+            request(rpc=rpc, method="eth_sendRawTransaction", params=[raw_tx])
+        except TRANSPORT_ERRORS as e:
+            known = _is_known(rpc=rpc, tx_hash=tx_hash)
+            if not known:
+                if known is None or not isinstance(e, RPCError):
+                    # The transaction may still be mined, its receipt decides
+                    tx_hashes.append(tx_hash)
+                return tx_hashes, e
+        tx_hashes.append(tx_hash)
+    return tx_hashes, None
+
+
+def wait_for_receipts(  # pylint: disable=too-many-arguments
+    rpc: str,
+    tx_hashes: t.Sequence[str],
+    timeout: float = ON_CHAIN_INTERACT_TIMEOUT,
+    sleep: float = ON_CHAIN_RECEIPT_POLL_INITIAL,
+    max_sleep: float = ON_CHAIN_RECEIPT_POLL_MAX,
+    factor: float = ON_CHAIN_RECEIPT_POLL_FACTOR,
+    batch_size: int = RPC_BATCH_SIZE,
+) -> t.List[t.Dict]:
+    """
+    Wait for the receipts of the given transactions
+
+    Every poll sends one `eth_getTransactionReceipt` batch for the
+    transactions that are still pending, the interval between polls grows
+    by `factor` up to `max_sleep`.
+
+    :param rpc: RPC endpoint.
+    :param tx_hashes: Transaction hashes.
+    :param timeout: Time to wait for all the receipts.
+    :param sleep: Time to sleep before the second poll.
+    :param max_sleep: Maximum time to sleep between polls.
+    :param factor: Backoff factor.
+    :param batch_size: Maximum number of calls per HTTP request.
+    :return: List of receipts in the same order as `tx_hashes`.
+    """
+    receipts: t.Dict[str, t.Dict] = {}
+    deadline = time.time() + timeout
+    while True:
+        pending = [tx_hash for tx_hash in tx_hashes if tx_hash not in receipts]
+        results = batch_request(
+            rpc=rpc,
+            calls=[("eth_getTransactionReceipt", [tx_hash]) for tx_hash in pending],
+            batch_size=batch_size,
+        )
+        for tx_hash, receipt in zip(pending, results):
+            if receipt is not None:
+                receipts[tx_hash] = receipt
+        if len(receipts) == len(set(tx_hashes)):
+            return [receipts[tx_hash] for tx_hash in tx_hashes]
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise RuntimeError("Timeout while waiting for transaction receipts")
+        time.sleep(min(sleep, remaining))
+        sleep = min(sleep * factor, max_sleep)
+
+
+async def _a_post(
+    session: aiohttp.ClientSession,
+    rpc: str,
+    payload: t.Any,
+) -> t.Any:
+    """POST a JSON-RPC payload."""
+    async with session.post(
+        rpc,
+        json=payload,
+        timeout=aiohttp.ClientTimeout(total=RPC_REQUEST_TIMEOUT),
+    ) as response:
+        response.raise_for_status()
+        return await response.json(content_type=None)
+
+
+async def a_batch_request(
+    rpc: str,
+    calls: t.Sequence[RPCCall],
+    batch_size: int = RPC_BATCH_SIZE,
+    session: t.Optional[aiohttp.ClientSession] = None,
+) -> t.List[t.Any]:
+    """Async version of `batch_request`."""
+    if session is None:
+        async with aiohttp.ClientSession() as _session:
+            return await a_batch_request(
+                rpc=rpc,
+                calls=calls,
+                batch_size=batch_size,
+                session=_session,
+            )
+
+    results: t.List[t.Any] = []
+    for offset in range(0, len(calls), batch_size):
+        chunk = calls[offset : offset + batch_size]
+        payload = _payload(calls=chunk, offset=offset)
+        responses = await _a_post(session=session, rpc=rpc, payload=payload)
+        if not isinstance(responses, list):
+            # Batches are not supported by the endpoint
+            for method, params in chunk:
+                results.append(
+                    await a_request(
+                        rpc=rpc,
+                        method=method,
+                        params=params,
+                        session=session,
+                    )
+                )
+            continue
+        results += _results(
+            responses=responses,
+            ids=(call["id"] for call in payload),
+        )
+    return results
+
+
+async def a_request(
+    rpc: str,
+    method: str,
+    params: t.List[t.Any],
+    session: t.Optional[aiohttp.ClientSession] = None,
+) -> t.Any:
+    """Send a single JSON-RPC call."""
+    if session is None:
+        async with aiohttp.ClientSession() as _session:
+            return await a_request(
+                rpc=rpc,
+                method=method,
+                params=params,
+                session=_session,
+            )
+
+    (payload,) = _payload(calls=[(method, params)])
+    response = await _a_post(session=session, rpc=rpc, payload=payload)
+    (result,) = _results(responses=[response], ids=[payload["id"]])
+    return result
+
+
+async def a_get_balances(
+    rpc: str,
+    addresses: t.Sequence[str],
+    batch_size: int = RPC_BATCH_SIZE,
+    session: t.Optional[aiohttp.ClientSession] = None,
+) -> t.List[int]:
+    """Async version of `get_balances`."""
+    return [
+        int(balance, 16)
+        for balance in await a_batch_request(
+            rpc=rpc,
+            calls=[("eth_getBalance", [address, "latest"]) for address in addresses],
+            batch_size=batch_size,
+            session=session,
+        )
+    ]
+
+
+async def a_get_erc20_balance(
+    rpc: str,
+    token: str,
+    address: str,
+    session: t.Optional[aiohttp.ClientSession] = None,
+) -> int:
+    """Get the ERC20 `balanceOf` an address."""
+    data = ERC20_BALANCE_OF_SELECTOR + address[2:].lower().rjust(64, "0")
+    result = await a_request(
+        rpc=rpc,
+        method="eth_call",
+        params=[{"to": token, "data": data}, "latest"],
+        session=session,
+    )
+    return int(result, 16)
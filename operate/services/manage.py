@@ -21,23 +21,29 @@
 """Service manager."""
 
 import asyncio
+import functools
 import logging
 import os
 import shutil
+import threading
 import traceback
 import typing as t
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+import aiohttp
 import requests
 from aea.helpers.base import IPFSHash
 from aea.helpers.logging import setup_logger
 from autonomy.chain.base import registry_contracts
 
+from operate.constants import STATE_JSON
 from operate.keys import Key, KeysManager
-from operate.ledger import PUBLIC_RPCS
+from operate.ledger import PUBLIC_RPCS, get_ws_rpc
+from operate.ledger.events import EventSubscriber, service_state_subscriber
 from operate.ledger.profiles import CONTRACTS, OLAS, STAKING
+from operate.ledger.rpc import a_get_balances, a_get_erc20_balance, get_balances
 from operate.services.protocol import EthSafeTxBuilder, OnChainManager, StakingState
 from operate.services.service import (
     ChainConfig,
@@ -49,9 +55,9 @@ from operate.services.service import (
     OnChainUserParams,
     Service,
 )
-from operate.types import ChainType, LedgerConfig, ServiceTemplate
+from operate.types import ChainType, LedgerConfig, LedgerType, ServiceTemplate
 from operate.utils.gnosis import NULL_ADDRESS
-from operate.wallet.master import MasterWalletManager
+from operate.wallet.master import MasterWallet, MasterWalletManager
 
 
 # pylint: disable=redefined-builtin
@@ -69,6 +75,25 @@ SERVICE_YAML = "service.yaml"
 HTTP_OK = 200
 URI_HASH_POSITION = 7
 IPFS_GATEWAY = "https://gateway.autonolas.tech/ipfs/"
+SERVICE_LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+async def _none() -> None:
+    """Placeholder for a skipped `asyncio.gather` entry."""
+
+
+def _gather(*aws: t.Awaitable) -> t.List[t.Any]:
+    """Run `aws` concurrently, also when called from a running event loop."""
+
+    async def _main() -> t.List[t.Any]:
+        return await asyncio.gather(*aws)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_main())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _main()).result()
 
 
 class ServiceManager:
@@ -93,6 +118,15 @@ class ServiceManager:
         self.keys_manager = keys_manager
         self.wallet_manager = wallet_manager
         self.logger = logger or setup_logger(name="operate.manager")
+        # The caches are shared by the request handlers and executor threads
+        self._lock = threading.Lock()
+        self._service_cache: t.Dict[Path, t.Tuple[t.Tuple[int, ...], Service]] = {}
+        self._wallets: t.Dict[LedgerType, t.Tuple[int, MasterWallet]] = {}
+        self._on_chain_managers: t.Dict[
+            t.Tuple[str, LedgerType, ChainType], OnChainManager
+        ] = {}
+        self._on_chain_states: t.Dict[t.Tuple[ChainType, int], OnChainState] = {}
+        self._event_subscribers: t.Dict[ChainType, EventSubscriber] = {}
         self._log_directories()
 
     def setup(self) -> None:
@@ -102,45 +136,217 @@ class ServiceManager:
     @property
     def json(self) -> t.List[t.Dict]:
         """Returns the list of available services."""
-        data = []
-        for path in self.path.iterdir():
+        return list(self.iter_services())
+
+    def iter_services(self) -> t.Iterator[t.Dict]:
+        """Iterate over the available services."""
+        with os.scandir(self.path) as entries:
+            paths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+            ]
+        service_paths = []
+        for path in paths:
             if path.name.startswith(DELETE_PREFIX):
                 shutil.rmtree(path)
                 continue
-            if not path.name.startswith("bafybei"):
-                continue
+            if path.name.startswith("bafybei"):
+                service_paths.append(path)
+
+        # Loading is I/O bound, parse the services missing from the cache in
+        # parallel when there is more than one
+        futures: t.Dict[Path, Future] = {}
+        mtimes = {path: self._service_mtime(path=path) for path in service_paths}
+        stale = [
+            path
+            for path in service_paths
+            if not self._is_cached(path=path, mtime=mtimes[path])
+        ]
+        if len(stale) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(SERVICE_LOAD_WORKERS, len(stale))
+            ) as executor:
+                futures = {
+                    path: executor.submit(
+                        self._load_cached, path=path, mtime=mtimes[path]
+                    )
+                    for path in stale
+                }
+
+        for path in service_paths:
             try:
-                service = Service.load(path=path)
-                data.append(service.json)
+                future = futures.get(path)
+                service = (
+                    future.result()
+                    if future is not None
+                    else self._load_cached(path=path, mtime=mtimes[path])
+                )
             except Exception as e:  # pylint: disable=broad-except
                 self.logger.warning(
                     f"Failed to load service: {path.name}. Exception: {e}"
                 )
                 # delete the invalid path
+                with self._lock:
+                    self._service_cache.pop(path, None)
                 shutil.rmtree(path)
                 self.logger.info(f"Deleted invalid service: {path.name}")
-        return data
+                continue
+            yield service.json
+
+    @staticmethod
+    def _service_mtime(path: Path) -> t.Tuple[int, ...]:
+        """
+        Modification times of the files a service is loaded from
+
+        The directory entry mtime cannot be used, it does not change when
+        `config.json` is rewritten in place.
+        """
+        mtimes = []
+        for file in (path / Service._file, path / STATE_JSON):
+            try:
+                mtimes.append(file.stat().st_mtime_ns)
+            except FileNotFoundError:
+                continue
+        return tuple(mtimes)
+
+    def _is_cached(self, path: Path, mtime: t.Tuple[int, ...]) -> bool:
+        """Whether the cached service object for `path` is up to date."""
+        with self._lock:
+            cached = self._service_cache.get(path)
+        return cached is not None and cached[0] == mtime
+
+    def _load_cached(self, path: Path, mtime: t.Tuple[int, ...]) -> Service:
+        """Load a service, reusing the cached object if `mtime` is unchanged."""
+        with self._lock:
+            cached = self._service_cache.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        service = Service.load(path=path)
+        # `Service.load` may rewrite the file when migrating the format
+        mtime = self._service_mtime(path=path)
+        with self._lock:
+            self._service_cache[path] = (mtime, service)
+        return service
 
     def exists(self, service: str) -> bool:
         """Check if service exists."""
         return (self.path / service).exists()
 
-    def get_on_chain_manager(self, service: Service) -> OnChainManager:
+    def _load_wallet(self, ledger_type: LedgerType) -> MasterWallet:
+        """Load a master wallet, cached until its config file changes."""
+        if not self.wallet_manager.exists(ledger_type=ledger_type):
+            return self.wallet_manager.load(ledger_type=ledger_type)
+        mtime = (self.wallet_manager.path / ledger_type.config_file).stat().st_mtime_ns
+        with self._lock:
+            cached = self._wallets.get(ledger_type)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        wallet = self.wallet_manager.load(ledger_type=ledger_type)
+        with self._lock:
+            self._wallets[ledger_type] = (mtime, wallet)
+        return wallet
+
+    def get_on_chain_manager(self, ledger_config: LedgerConfig) -> OnChainManager:
         """Get OnChainManager instance."""
-        return OnChainManager(
-            rpc=service.ledger_config.rpc,
-            wallet=self.wallet_manager.load(service.ledger_config.type),
-            contracts=CONTRACTS[service.ledger_config.chain],
-        )
+        key = (ledger_config.rpc, ledger_config.type, ledger_config.chain)
+        wallet = self._load_wallet(ledger_type=ledger_config.type)
+        with self._lock:
+            manager = self._on_chain_managers.get(key)
+            if manager is None or manager.wallet is not wallet:
+                manager = OnChainManager(
+                    rpc=ledger_config.rpc,
+                    wallet=wallet,
+                    contracts=CONTRACTS[ledger_config.chain],
+                )
+                self._on_chain_managers[key] = manager
+        return manager
 
     def get_eth_safe_tx_builder(self, ledger_config: LedgerConfig) -> EthSafeTxBuilder:
         """Get EthSafeTxBuilder instance."""
         return EthSafeTxBuilder(
             rpc=ledger_config.rpc,
-            wallet=self.wallet_manager.load(ledger_config.type),
+            wallet=self._load_wallet(ledger_type=ledger_config.type),
             contracts=CONTRACTS[ledger_config.chain],
         )
 
+    def close(self) -> None:
+        """Stop the event subscriptions."""
+        with self._lock:
+            subscribers = list(self._event_subscribers.values())
+            self._event_subscribers.clear()
+        for subscriber in subscribers:
+            subscriber.stop()
+
+    def _follow_service_states(
+        self, chain: ChainType, ocm: t.Union[OnChainManager, EthSafeTxBuilder]
+    ) -> bool:
+        """Follow the service state events on `chain`, returns whether it is live."""
+        with self._lock:
+            subscriber = self._event_subscribers.get(chain)
+            if subscriber is None:
+                rpc = get_ws_rpc(chain=chain)
+                if rpc is None:
+                    return False
+                subscriber = service_state_subscriber(
+                    rpc=rpc,
+                    service_registry=ocm.contracts["service_registry"],
+                    on_state=functools.partial(self._set_service_state, chain),
+                    on_connect=functools.partial(self._reset_service_states, chain),
+                    logger=self.logger,
+                )
+                self._event_subscribers[chain] = subscriber
+        subscriber.start()
+        return subscriber.connected
+
+    def _set_service_state(
+        self, chain: ChainType, token: int, state: OnChainState
+    ) -> None:
+        """Record a service state, a late event must not undo a newer state."""
+        with self._lock:
+            current = self._on_chain_states.get((chain, token))
+            if current is None or state > current:
+                self._on_chain_states[(chain, token)] = state
+
+    def _reset_service_states(self, chain: ChainType) -> None:
+        """Forget the recorded service states on `chain`."""
+        with self._lock:
+            for key in [key for key in self._on_chain_states if key[0] == chain]:
+                self._on_chain_states.pop(key, None)
+
+    def _forget_service_state(self, chain: ChainType, token: int) -> None:
+        """Forget the recorded state of a service, e.g. once it is terminated."""
+        with self._lock:
+            self._on_chain_states.pop((chain, token), None)
+
+    def _get_service_state(
+        self,
+        chain: ChainType,
+        token: int,
+        ocm: t.Union[OnChainManager, EthSafeTxBuilder],
+        expected: t.Optional[OnChainState] = None,
+    ) -> OnChainState:
+        """
+        Get the service state, from the recorded events while subscribed
+
+        A settled Safe transaction does not mean its inner call succeeded, so
+        a recorded state is only used once it reached `expected`. Otherwise the
+        state is read from the chain and recorded.
+        """
+        with self._lock:
+            state = self._on_chain_states.get((chain, token))
+        if (
+            state is not None
+            and (expected is None or state >= expected)
+            and self._follow_service_states(chain=chain, ocm=ocm)
+        ):
+            return state
+        info = ocm.info_batched(token_id=token)
+        state = OnChainState(info["service_state"])
+        with self._lock:
+            self._on_chain_states[(chain, token)] = state
+        return state
+
     def load_or_create(
         self,
         hash: str,
@@ -156,6 +362,9 @@ class ServiceManager:
         :return: Service instance
         """
         path = self.path / hash
+        # Callers of `load_or_create` may mutate and store the service
+        with self._lock:
+            self._service_cache.pop(path, None)
         if path.exists():
             service = Service.load(path=path)
 
@@ -179,10 +388,9 @@ class ServiceManager:
         )
 
         if not service.keys:
-            service.keys = [
-                self.keys_manager.get(self.keys_manager.create())
-                for _ in range(service.helper.config.number_of_agents)
-            ]
+            service.keys = self.keys_manager.create_many(
+                n=service.helper.config.number_of_agents
+            )
             service.store()
 
         return service
@@ -197,20 +405,23 @@ class ServiceManager:
             return service_state
 
         sftxb = self.get_eth_safe_tx_builder(ledger_config=ledger_config)
-        info = sftxb.info(token_id=chain_data.token)
+        info = sftxb.info_batched(token_id=chain_data.token)
         service_state = OnChainState(info["service_state"])
         chain_data.on_chain_state = service_state
         # TODO save service state
         return service_state
 
-    def _get_on_chain_hash(self, chain_config: ChainConfig) -> t.Optional[str]:
+    def _get_on_chain_hash(
+        self, chain_config: ChainConfig, info: t.Optional[t.Dict] = None
+    ) -> t.Optional[str]:
         chain_data = chain_config.chain_data
         ledger_config = chain_config.ledger_config
         if chain_data.token == NON_EXISTENT_TOKEN:
             return None
 
-        sftxb = self.get_eth_safe_tx_builder(ledger_config=ledger_config)
-        info = sftxb.info(token_id=chain_data.token)
+        if info is None:
+            sftxb = self.get_eth_safe_tx_builder(ledger_config=ledger_config)
+            info = sftxb.info_batched(token_id=chain_data.token)
         config_hash = info["config_hash"]
         res = requests.get(f"{IPFS_GATEWAY}f01701220{config_hash}", timeout=30)
         if res.status_code == 200:
@@ -235,14 +446,21 @@ class ServiceManager:
         user_params = service.chain_data.user_params
         keys = service.keys
         instances = [key.address for key in keys]
-        ocm = self.get_on_chain_manager(service=service)
+        ocm = self.get_on_chain_manager(ledger_config=service.ledger_config)
+        chain = service.ledger_config.chain
+        staking_token = staking_contract = None
+        if user_params.use_staking:
+            # Chains without staking are missing from `OLAS` and `STAKING`
+            staking_token = OLAS[chain]
+            staking_contract = STAKING[chain]
+
         if user_params.use_staking and not ocm.staking_slots_available(
-            staking_contract=STAKING[service.ledger_config.chain]
+            staking_contract=staking_contract
         ):
             raise ValueError("No staking slots available")
 
         if user_params.use_staking and not ocm.staking_rewards_available(
-            staking_contract=STAKING[service.ledger_config.chain]
+            staking_contract=staking_contract
         ):
             raise ValueError("No staking rewards available")
 
@@ -272,7 +490,7 @@ class ServiceManager:
             balance = (
                 registry_contracts.erc20.get_instance(
                     ledger_api=ocm.ledger_api,
-                    contract_address=OLAS[service.ledger_config.chain],
+                    contract_address=staking_token,
                 )
                 .functions.balanceOf(ocm.crypto.address)
                 .call()
@@ -299,11 +517,7 @@ class ServiceManager:
                     threshold=user_params.threshold,
                     nft=IPFSHash(user_params.nft),
                     update_token=service.chain_data.token if update else None,
-                    token=(
-                        OLAS[service.ledger_config.chain]
-                        if user_params.use_staking
-                        else None
-                    ),
+                    token=staking_token,
                 ).get("token"),
             )
             service.chain_data.on_chain_state = OnChainState.PRE_REGISTRATION
@@ -316,11 +530,7 @@ class ServiceManager:
             self.logger.info("Activating service")
             ocm.activate(
                 service_id=service.chain_data.token,
-                token=(
-                    OLAS[service.ledger_config.chain]
-                    if user_params.use_staking
-                    else None
-                ),
+                token=staking_token,
             )
             service.chain_data.on_chain_state = OnChainState.ACTIVE_REGISTRATION
             service.store()
@@ -334,11 +544,7 @@ class ServiceManager:
                 service_id=service.chain_data.token,
                 instances=instances,
                 agents=[user_params.agent_id for _ in instances],
-                token=(
-                    OLAS[service.ledger_config.chain]
-                    if user_params.use_staking
-                    else None
-                ),
+                token=staking_token,
             )
             service.chain_data.on_chain_state = OnChainState.FINISHED_REGISTRATION
             service.store()
@@ -351,11 +557,7 @@ class ServiceManager:
             ocm.deploy(
                 service_id=service.chain_data.token,
                 reuse_multisig=update,
-                token=(
-                    OLAS[service.ledger_config.chain]
-                    if user_params.use_staking
-                    else None
-                ),
+                token=staking_token,
             )
             service.chain_data.on_chain_state = OnChainState.DEPLOYED
             service.store()
@@ -401,13 +603,33 @@ class ServiceManager:
 
         self.logger.info(f"_deploy_service_onchain_from_safe {chain_id=}")
         service = self.load_or_create(hash=hash)
+        try:
+            self._deploy_service_onchain_from_safe_single_chain(
+                service=service,
+                chain_id=chain_id,
+                fallback_staking_params=fallback_staking_params,
+            )
+        finally:
+            # Persist the checkpointed progress if a stage failed
+            if service.dirty:
+                service.store()
+
+    def _deploy_service_onchain_from_safe_single_chain(  # pylint: disable=too-many-statements,too-many-locals
+        self,
+        service: Service,
+        chain_id: str,
+        fallback_staking_params: t.Optional[t.Dict] = None,
+    ) -> None:
+        """Run the on-chain deployment stages, checkpointing after each one."""
+        hash = service.hash
         chain_config = service.chain_configs[chain_id]
         ledger_config = chain_config.ledger_config
+        chain = ledger_config.chain
         chain_data = chain_config.chain_data
         user_params = chain_config.chain_data.user_params
         keys = service.keys
         instances = [key.address for key in keys]
-        wallet = self.wallet_manager.load(ledger_config.type)
+        wallet = self._load_wallet(ledger_type=ledger_config.type)
         sftxb = self.get_eth_safe_tx_builder(ledger_config=ledger_config)
         chain_type = ChainType.from_id(int(chain_id))
         safe = wallet.safes[chain_type]
@@ -417,23 +639,52 @@ class ServiceManager:
             "OPEN_AUTONOMY_SUBGRAPH_URL"
         ] = "https://subgraph.autonolas.tech/subgraphs/name/autonolas-staging"
 
+        # Stage results are confirmed by the registry events when subscribed
+        self._follow_service_states(chain=chain, ocm=sftxb)
+
+        staking_token = staking_contract = None
+        if user_params.use_staking:
+            staking_token = OLAS[chain]
+            staking_contract = STAKING[chain][user_params.staking_program_id]
+
+        # The service info and the staking reads are independent
+        info, staking_precheck = _gather(
+            (
+                sftxb.a_info_batched(token_id=chain_data.token)
+                if chain_data.token > -1
+                else _none()
+            ),
+            (
+                sftxb.a_staking_precheck(
+                    staking_contract=t.cast(str, staking_contract),
+                    token=t.cast(str, staking_token),
+                    owner=safe,
+                )
+                if user_params.use_staking
+                else _none()
+            ),
+        )
+
         current_agent_id = None
-        if chain_data.token > -1:
+        if info is not None:
             self.logger.info("Syncing service state")
-            info = sftxb.info(token_id=chain_data.token)
             chain_data.on_chain_state = OnChainState(info["service_state"])
             chain_data.instances = info["instances"]
             chain_data.multisig = info["multisig"]
             current_agent_id = info["canonical_agents"][0]  # TODO Allow multiple agents
-            service.store()
+            service.store_state_only()
+            self._forget_service_state(chain=chain, token=chain_data.token)
+            self._set_service_state(
+                chain=chain,
+                token=chain_data.token,
+                state=chain_data.on_chain_state,
+            )
+        else:
+            chain_data.on_chain_state = OnChainState.NON_EXISTENT
         self.logger.info(f"Service state: {chain_data.on_chain_state.name}")
 
         if user_params.use_staking:
-            staking_params = sftxb.get_staking_params(
-                staking_contract=STAKING[ledger_config.chain][
-                    user_params.staking_program_id
-                ],
-            )
+            staking_params = staking_precheck["params"]
         elif fallback_staking_params is not None:
             staking_params = fallback_staking_params
         else:
@@ -458,14 +709,7 @@ class ServiceManager:
             else:
                 required_olas = 0
 
-            balance = (
-                registry_contracts.erc20.get_instance(
-                    ledger_api=sftxb.ledger_api,
-                    contract_address=OLAS[ledger_config.chain],
-                )
-                .functions.balanceOf(safe)
-                .call()
-            )
+            balance = staking_precheck["balance"]
             if balance < required_olas:
                 raise ValueError(
                     "You don't have enough olas to stake, "
@@ -477,19 +721,20 @@ class ServiceManager:
             if staking_params["agent_ids"]
             else fallback_staking_params["agent_ids"][0]
         )
-        on_chain_hash = self._get_on_chain_hash(chain_config=chain_config)
-        is_first_mint = (
-            self._get_on_chain_state(chain_config=chain_config)
-            == OnChainState.NON_EXISTENT
-        )
+        on_chain_hash = self._get_on_chain_hash(chain_config=chain_config, info=info)
+        is_first_mint = chain_data.on_chain_state == OnChainState.NON_EXISTENT
         is_update = (
             (not is_first_mint)
             and (on_chain_hash is not None)
             and (current_agent_id != agent_id)
         )
 
+        changed = False
         if is_update:
+            # The termination flow works on the stored service
+            service.store()
             self._terminate_service_on_chain_from_safe(hash=hash, chain_id=chain_id)
+            changed = True
             # Update service
             if (
                 self._get_on_chain_state(chain_config=chain_config)
@@ -530,18 +775,17 @@ class ServiceManager:
                     ).get("events"),
                 )
                 chain_data.on_chain_state = OnChainState.PRE_REGISTRATION
-                service.store()
+                service.store_state_only()
+                chain_data.on_chain_state = self._get_service_state(
+                    chain=chain,
+                    token=chain_data.token,
+                    ocm=sftxb,
+                    expected=OnChainState.PRE_REGISTRATION,
+                )
 
         # Mint service
-        if (
-            self._get_on_chain_state(chain_config=chain_config)
-            == OnChainState.NON_EXISTENT
-        ):
-            if user_params.use_staking and not sftxb.staking_slots_available(
-                staking_contract=STAKING[ledger_config.chain][
-                    user_params.staking_program_id
-                ]
-            ):
+        if chain_data.on_chain_state == OnChainState.NON_EXISTENT:
+            if user_params.use_staking and not staking_precheck["slots_available"]:
                 raise ValueError("No staking slots available")
 
             self.logger.info("Minting service")
@@ -580,12 +824,16 @@ class ServiceManager:
             )
             chain_data.token = event_data["args"]["serviceId"]
             chain_data.on_chain_state = OnChainState.PRE_REGISTRATION
-            service.store()
+            service.store_state_only()
+            chain_data.on_chain_state = self._get_service_state(
+                chain=chain,
+                token=chain_data.token,
+                ocm=sftxb,
+                expected=OnChainState.PRE_REGISTRATION,
+            )
+            changed = True
 
-        if (
-            self._get_on_chain_state(chain_config=chain_config)
-            == OnChainState.PRE_REGISTRATION
-        ):
+        if chain_data.on_chain_state == OnChainState.PRE_REGISTRATION:
             cost_of_bond = user_params.cost_of_bond
             if user_params.use_staking:
                 token_utility = staking_params["service_registry_token_utility"]
@@ -632,12 +880,16 @@ class ServiceManager:
                 )
             ).settle()
             chain_data.on_chain_state = OnChainState.ACTIVE_REGISTRATION
-            service.store()
+            service.store_state_only()
+            chain_data.on_chain_state = self._get_service_state(
+                chain=chain,
+                token=chain_data.token,
+                ocm=sftxb,
+                expected=OnChainState.ACTIVE_REGISTRATION,
+            )
+            changed = True
 
-        if (
-            self._get_on_chain_state(chain_config=chain_config)
-            == OnChainState.ACTIVE_REGISTRATION
-        ):
+        if chain_data.on_chain_state == OnChainState.ACTIVE_REGISTRATION:
             cost_of_bond = user_params.cost_of_bond
             if user_params.use_staking:
                 token_utility = staking_params["service_registry_token_utility"]
@@ -688,16 +940,20 @@ class ServiceManager:
                 )
             ).settle()
             chain_data.on_chain_state = OnChainState.FINISHED_REGISTRATION
-            service.store()
+            service.store_state_only()
+            chain_data.on_chain_state = self._get_service_state(
+                chain=chain,
+                token=chain_data.token,
+                ocm=sftxb,
+                expected=OnChainState.FINISHED_REGISTRATION,
+            )
+            changed = True
 
-        if (
-            self._get_on_chain_state(chain_config=chain_config)
-            == OnChainState.FINISHED_REGISTRATION
-        ):
+        if chain_data.on_chain_state == OnChainState.FINISHED_REGISTRATION:
             self.logger.info("Deploying service")
 
             reuse_multisig = True
-            info = sftxb.info(token_id=chain_data.token)
+            info = sftxb.info_batched(token_id=chain_data.token)
             if info["multisig"] == NULL_ADDRESS:
                 reuse_multisig = False
 
@@ -714,10 +970,12 @@ class ServiceManager:
             tx.settle()
 
             chain_data.on_chain_state = OnChainState.DEPLOYED
-            service.store()
+            service.store_state_only()
+            changed = True
 
-        # Update local Service
-        info = sftxb.info(token_id=chain_data.token)
+        # Update local Service, the entry read is current if nothing changed
+        if changed or info is None:
+            info = sftxb.info_batched(token_id=chain_data.token)
         chain_data.instances = info["instances"]
         chain_data.multisig = info["multisig"]
         chain_data.on_chain_state = OnChainState(info["service_state"])
@@ -732,7 +990,11 @@ class ServiceManager:
         :param hash: Service hash
         """
         service = self.load_or_create(hash=hash)
-        ocm = self.get_on_chain_manager(service=service)
+        chain = service.ledger_config.chain
+        staking_token = (
+            OLAS[chain] if service.chain_data.user_params.use_staking else None
+        )
+        ocm = self.get_on_chain_manager(ledger_config=service.ledger_config)
         info = ocm.info(token_id=service.chain_data.token)
         service.chain_data.on_chain_state = OnChainState(info["service_state"])
 
@@ -743,14 +1005,11 @@ class ServiceManager:
         self.logger.info("Terminating service")
         ocm.terminate(
             service_id=service.chain_data.token,
-            token=(
-                OLAS[service.ledger_config.chain]
-                if service.chain_data.user_params.use_staking
-                else None
-            ),
+            token=staking_token,
         )
         service.chain_data.on_chain_state = OnChainState.TERMINATED_BONDED
         service.store()
+        self._forget_service_state(chain=chain, token=service.chain_data.token)
 
     def _terminate_service_on_chain_from_safe(  # pylint: disable=too-many-locals
         self, hash: str, chain_id: str
@@ -764,10 +1023,11 @@ class ServiceManager:
         service = self.load_or_create(hash=hash)
         chain_config = service.chain_configs[chain_id]
         ledger_config = chain_config.ledger_config
+        chain = ledger_config.chain
         chain_data = chain_config.chain_data
         keys = service.keys
         instances = [key.address for key in keys]
-        wallet = self.wallet_manager.load(ledger_config.type)
+        wallet = self._load_wallet(ledger_type=ledger_config.type)
         chain_type = ChainType.from_id(int(chain_id))
 
         # TODO fixme
@@ -785,9 +1045,10 @@ class ServiceManager:
 
         can_unstake = False
         if current_staking_program is not None:
+            current_staking_contract = STAKING[chain][current_staking_program]
             can_unstake = sftxb.can_unstake(
                 service_id=chain_data.token,
-                staking_contract=STAKING[ledger_config.chain][current_staking_program],
+                staking_contract=current_staking_contract,
             )
 
         # Cannot unstake, terminate flow.
@@ -795,23 +1056,37 @@ class ServiceManager:
             self.logger.info("Service cannot be terminated on-chain: cannot unstake.")
             return
 
-        # Unstake the service if applies
-        if is_staked and can_unstake:
-            self.unstake_service_on_chain_from_safe(
-                hash=hash, chain_id=chain_id, staking_program_id=current_staking_program
+        # Unstake and terminate in a single Safe multisend, unstaking does not
+        # change the registry state
+        tx = sftxb.new_tx()
+        settle = False
+        if is_staked:
+            self.logger.info(f"Unstaking service: {chain_data.token}")
+            tx.add(
+                sftxb.get_unstaking_data(
+                    service_id=chain_data.token,
+                    staking_contract=current_staking_contract,
+                )
             )
+            settle = True
 
-        if self._get_on_chain_state(chain_config) in (
+        if chain_data.on_chain_state in (
             OnChainState.ACTIVE_REGISTRATION,
             OnChainState.FINISHED_REGISTRATION,
             OnChainState.DEPLOYED,
         ):
             self.logger.info("Terminating service")
-            sftxb.new_tx().add(
+            tx.add(
                 sftxb.get_terminate_data(
                     service_id=chain_data.token,
                 )
-            ).settle()
+            )
+            settle = True
+
+        if settle:
+            tx.settle()
+            chain_data.staked = False
+            service.store()
 
         if self._get_on_chain_state(chain_config) == OnChainState.TERMINATED_BONDED:
             self.logger.info("Unbonding service")
@@ -820,6 +1095,7 @@ class ServiceManager:
                     service_id=chain_data.token,
                 )
             ).settle()
+        self._forget_service_state(chain=chain, token=chain_data.token)
 
         # Swap service safe
         current_safe_owners = sftxb.get_service_safe_owners(service_id=chain_data.token)
@@ -864,7 +1140,11 @@ class ServiceManager:
         :param hash: Service hash
         """
         service = self.load_or_create(hash=hash)
-        ocm = self.get_on_chain_manager(service=service)
+        chain = service.ledger_config.chain
+        staking_token = (
+            OLAS[chain] if service.chain_data.user_params.use_staking else None
+        )
+        ocm = self.get_on_chain_manager(ledger_config=service.ledger_config)
         info = ocm.info(token_id=service.chain_data.token)
         service.chain_data.on_chain_state = OnChainState(info["service_state"])
 
@@ -875,14 +1155,11 @@ class ServiceManager:
         self.logger.info("Unbonding service")
         ocm.unbond(
             service_id=service.chain_data.token,
-            token=(
-                OLAS[service.ledger_config.chain]
-                if service.chain_data.user_params.use_staking
-                else None
-            ),
+            token=staking_token,
         )
         service.chain_data.on_chain_state = OnChainState.UNBONDED
         service.store()
+        self._forget_service_state(chain=chain, token=service.chain_data.token)
 
     def stake_service_on_chain(
         self, hash: str, chain_id: int, staking_program_id: str
@@ -907,10 +1184,11 @@ class ServiceManager:
         service = self.load_or_create(hash=hash)
         chain_config = service.chain_configs[chain_id]
         ledger_config = chain_config.ledger_config
+        chain = ledger_config.chain
         chain_data = chain_config.chain_data
         user_params = chain_data.user_params
         target_staking_program = user_params.staking_program_id
-        target_staking_contract = STAKING[ledger_config.chain][target_staking_program]
+        target_staking_contract = STAKING[chain][target_staking_program]
         sftxb = self.get_eth_safe_tx_builder(ledger_config=ledger_config)
 
         # TODO fixme
@@ -922,7 +1200,7 @@ class ServiceManager:
         )
         is_staked = current_staking_program is not None
         current_staking_contract = (
-            STAKING[ledger_config.chain][current_staking_program] if is_staked else None
+            STAKING[chain][current_staking_program] if is_staked else None
         )
 
         # perform the unstaking flow if necessary
@@ -1022,7 +1300,7 @@ class ServiceManager:
             sftxb.new_tx().add(
                 sftxb.get_staking_approval_data(
                     service_id=chain_config.chain_data.token,
-                    service_registry=CONTRACTS[ledger_config.chain]["service_registry"],
+                    service_registry=CONTRACTS[chain]["service_registry"],
                     staking_contract=target_staking_contract,
                 )
             ).settle()
@@ -1054,10 +1332,11 @@ class ServiceManager:
             self.logger.info("Cannot unstake service, `use_staking` is set to false")
             return
 
-        ocm = self.get_on_chain_manager(service=service)
+        staking_contract = STAKING[service.ledger_config.chain]
+        ocm = self.get_on_chain_manager(ledger_config=service.ledger_config)
         state = ocm.staking_status(
             service_id=service.chain_data.token,
-            staking_contract=STAKING[service.ledger_config.chain],
+            staking_contract=staking_contract,
         )
         self.logger.info(
             f"Staking status for service {service.chain_data.token}: {state}"
@@ -1071,11 +1350,28 @@ class ServiceManager:
         self.logger.info(f"Unstaking service: {service.chain_data.token}")
         ocm.unstake(
             service_id=service.chain_data.token,
-            staking_contract=STAKING[service.ledger_config.chain],
+            staking_contract=staking_contract,
         )
         service.chain_data.staked = False
         service.store()
 
+    def stop_service_on_chain(
+        self, hash: str, chain_id: t.Optional[str] = None
+    ) -> None:
+        """
+        Unstake, terminate and unbond a service on-chain from the master Safe
+
+        :param hash: Service hash
+        :param chain_id: The chain id to use, defaults to the home chain.
+        """
+        service = self.load_or_create(hash=hash)
+        chain_id = chain_id or service.home_chain_id
+        if service.chain_configs[chain_id].chain_data.token == NON_EXISTENT_TOKEN:
+            self.logger.info("Cannot stop service, it is not minted")
+            return
+
+        self._terminate_service_on_chain_from_safe(hash=hash, chain_id=chain_id)
+
     def unstake_service_on_chain_from_safe(
         self, hash: str, chain_id: str, staking_program_id: str
     ) -> None:
@@ -1095,10 +1391,11 @@ class ServiceManager:
             self.logger.info("Cannot unstake service, `use_staking` is set to false")
             return
 
+        staking_contract = STAKING[ledger_config.chain][staking_program_id]
         sftxb = self.get_eth_safe_tx_builder(ledger_config=ledger_config)
         state = sftxb.staking_status(
             service_id=chain_data.token,
-            staking_contract=STAKING[ledger_config.chain][staking_program_id],
+            staking_contract=staking_contract,
         )
         self.logger.info(f"Staking status for service {chain_data.token}: {state}")
         if state not in {StakingState.STAKED, StakingState.EVICTED}:
@@ -1111,7 +1408,7 @@ class ServiceManager:
         sftxb.new_tx().add(
             sftxb.get_unstaking_data(
                 service_id=chain_data.token,
-                staking_contract=STAKING[ledger_config.chain][staking_program_id],
+                staking_contract=staking_contract,
             )
         ).settle()
         chain_data.staked = False
@@ -1134,16 +1431,20 @@ class ServiceManager:
         chain_config = service.chain_configs[chain_id]
         ledger_config = chain_config.ledger_config
         chain_data = chain_config.chain_data
-        wallet = self.wallet_manager.load(ledger_config.type)
-        ledger_api = wallet.ledger_api(
-            chain_type=ledger_config.chain, rpc=rpc or ledger_config.rpc
-        )
+        wallet = self._load_wallet(ledger_type=ledger_config.type)
         agent_fund_threshold = (
             agent_fund_threshold or chain_data.user_params.fund_requirements.agent
         )
 
-        for key in service.keys:
-            agent_balance = ledger_api.get_balance(address=key.address)
+        # Fetch the agent and safe balances in a single JSON-RPC batch
+        *agent_balances, safe_balance = get_balances(
+            rpc=rpc or ledger_config.rpc,
+            addresses=[key.address for key in service.keys] + [chain_data.multisig],
+        )
+        # Transfers from the EOA have no dependency on each other, so they are
+        # collected and submitted together with pre-assigned nonces
+        eoa_transfers: t.List[t.Tuple[str, int]] = []
+        for key, agent_balance in zip(service.keys, agent_balances):
             self.logger.info(f"Agent {key.address} balance: {agent_balance}")
             self.logger.info(f"Required balance: {agent_fund_threshold}")
             if agent_balance < agent_fund_threshold:
@@ -1152,6 +1453,9 @@ class ServiceManager:
                     agent_topup or chain_data.user_params.fund_requirements.agent
                 )
                 self.logger.info(f"Transferring {to_transfer} units to {key.address}")
+                if not from_safe:
+                    eoa_transfers.append((key.address, int(to_transfer)))
+                    continue
                 wallet.transfer(
                     to=key.address,
                     amount=int(to_transfer),
@@ -1160,7 +1464,6 @@ class ServiceManager:
                     rpc=rpc or ledger_config.rpc,
                 )
 
-        safe_balance = ledger_api.get_balance(chain_data.multisig)
         safe_fund_treshold = (
             safe_fund_treshold or chain_data.user_params.fund_requirements.safe
         )
@@ -1172,14 +1475,16 @@ class ServiceManager:
             self.logger.info(
                 f"Transferring {to_transfer} units to {chain_data.multisig}"
             )
-            wallet.transfer(
-                to=t.cast(str, chain_data.multisig),
-                amount=int(to_transfer),
-                chain_type=ledger_config.chain,
-                rpc=rpc or ledger_config.rpc,
-                from_safe=False  # hack
+            eoa_transfers.append(  # hack: always funded from the EOA
+                (t.cast(str, chain_data.multisig), int(to_transfer))
             )
 
+        wallet.transfer_many(
+            transfers=eoa_transfers,
+            chain_type=ledger_config.chain,
+            rpc=rpc or ledger_config.rpc,
+        )
+
     def fund_service_erc20(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         hash: str,
@@ -1197,16 +1502,20 @@ class ServiceManager:
         chain_config = service.chain_configs[chain_id]
         ledger_config = chain_config.ledger_config
         chain_data = chain_config.chain_data
-        wallet = self.wallet_manager.load(ledger_config.type)
-        ledger_api = wallet.ledger_api(
-            chain_type=ledger_config.chain, rpc=rpc or ledger_config.rpc
-        )
+        wallet = self._load_wallet(ledger_type=ledger_config.type)
         agent_fund_threshold = (
             agent_fund_threshold or chain_data.user_params.fund_requirements.agent
         )
 
-        for key in service.keys:
-            agent_balance = ledger_api.get_balance(address=key.address)
+        ((agent_balances, safe_balance),) = _gather(
+            self._a_get_funding_balances_erc20(
+                rpc=rpc or ledger_config.rpc,
+                token=token,
+                agents=[key.address for key in service.keys],
+                safe=chain_data.multisig,
+            )
+        )
+        for key, agent_balance in zip(service.keys, agent_balances):
             self.logger.info(f"Agent {key.address} balance: {agent_balance}")
             self.logger.info(f"Required balance: {agent_fund_threshold}")
             if agent_balance < agent_fund_threshold:
@@ -1224,11 +1533,6 @@ class ServiceManager:
                     rpc=rpc or ledger_config.rpc,
                 )
 
-        safe_balance = (
-            registry_contracts.erc20.get_instance(ledger_api, token)
-            .functions.balanceOf(chain_data.multisig)
-            .call()
-        )
         safe_fund_treshold = (
             safe_fund_treshold or chain_data.user_params.fund_requirements.safe
         )
@@ -1248,6 +1552,26 @@ class ServiceManager:
                 rpc=rpc or ledger_config.rpc,
             )
 
+    @staticmethod
+    async def _a_get_funding_balances_erc20(
+        rpc: str,
+        token: str,
+        agents: t.List[str],
+        safe: str,
+    ) -> t.Tuple[t.List[int], int]:
+        """Get the agent balances and the safe token balance concurrently."""
+        async with aiohttp.ClientSession() as session:
+            agent_balances, safe_balance = await asyncio.gather(
+                a_get_balances(rpc=rpc, addresses=agents, session=session),
+                a_get_erc20_balance(
+                    rpc=rpc,
+                    token=token,
+                    address=safe,
+                    session=session,
+                ),
+            )
+        return agent_balances, safe_balance
+
     async def funding_job(
         self,
         hash: str,
@@ -1324,6 +1648,10 @@ class ServiceManager:
         """Update a service."""
 
         self.logger.info("-----Entering update local service-----")
+        # The ledger configs may change with the new service
+        with self._lock:
+            self._on_chain_managers.clear()
+            self._wallets.clear()
         old_service = self.load_or_create(hash=old_hash)
         new_service = self.load_or_create(
             hash=new_hash, service_template=service_template
@@ -1345,12 +1673,16 @@ class ServiceManager:
                 )
 
         new_service.store()
+        with self._lock:
+            self._service_cache.pop(new_service.path, None)
 
         # The following logging has been added to identify OS issues when
         # deleting old service folder
         try:
             self._log_directories()
             self.logger.info("Trying to delete old service")
+            with self._lock:
+                self._service_cache.pop(old_service.path, None)
             old_service.delete()
         except Exception as e:  # pylint: disable=broad-except
             self.logger.error(
@@ -1362,5 +1694,6 @@ class ServiceManager:
         return new_service
 
     def _log_directories(self) -> None:
-        directories = [str(p) for p in self.path.iterdir() if p.is_dir()]
+        with os.scandir(self.path) as entries:
+            directories = [entry.path for entry in entries if entry.is_dir()]
         self.logger.info(f"Directories in {self.path}: {', '.join(directories)}")
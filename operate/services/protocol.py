@@ -68,6 +68,8 @@ from operate.data import DATA_DIR
 from operate.data.contracts.service_staking_token.contract import (
     ServiceStakingTokenContract,
 )
+from operate.ledger.http import use_persistent_session
+from operate.ledger.multicall import MulticallBatcher
 from operate.types import ChainType as OperateChainType
 from operate.types import ContractAddresses
 from operate.utils.gnosis import (
@@ -554,6 +556,7 @@ class _ChainUtil:
             key=self.wallet.key_path,
             password=self.wallet.password,
         )
+        use_persistent_session(web3=ledger_api.api, rpc=self.rpc)
         return ledger_api
 
     @property
@@ -616,6 +619,157 @@ class _ChainUtil:
             instances=instances,
         )
 
+    def _info_batch(self, token_id: int) -> MulticallBatcher:
+        """Build the Multicall3 batch for service info."""
+        self._patch()
+        ledger_api, _ = OnChainHelper.get_ledger_and_crypto_objects(
+            chain_type=self.chain_type
+        )
+        registry = registry_contracts.service_registry.get_instance(
+            ledger_api=ledger_api,
+            contract_address=self.contracts["service_registry"],
+        )
+        return (
+            MulticallBatcher(ledger_api=ledger_api)
+            .add(registry, "getService", [token_id])
+            .add(registry, "getAgentInstances", [token_id])
+        )
+
+    @staticmethod
+    def _parse_info_batch(ledger_api: LedgerApi, results: t.List) -> t.Dict:
+        """Parse the service info batch results."""
+        (
+            (
+                security_deposit,
+                multisig_address,
+                config_hash,
+                threshold,
+                max_agents,
+                number_of_agent_instances,
+                service_state,
+                canonical_agents,
+            ),
+            (_, instances),
+        ) = results
+        to_checksum_address = ledger_api.api.to_checksum_address
+        return dict(
+            security_deposit=security_deposit,
+            multisig=to_checksum_address(multisig_address),
+            config_hash=bytes(config_hash).hex(),
+            threshold=threshold,
+            max_agents=max_agents,
+            number_of_agent_instances=number_of_agent_instances,
+            service_state=service_state,
+            canonical_agents=list(canonical_agents),
+            instances=[to_checksum_address(instance) for instance in instances],
+        )
+
+    def info_batched(self, token_id: int) -> t.Dict:
+        """Get service info using a single Multicall3 call."""
+        batch = self._info_batch(token_id=token_id)
+        return self._parse_info_batch(
+            ledger_api=batch.ledger_api,
+            results=batch.call(),
+        )
+
+    async def a_info_batched(self, token_id: int) -> t.Dict:
+        """Async version of `info_batched`."""
+        batch = self._info_batch(token_id=token_id)
+        return self._parse_info_batch(
+            ledger_api=batch.ledger_api,
+            results=await batch.a_call(rpc=self.rpc),
+        )
+
+    def _staking_precheck_batch(
+        self, staking_contract: str, token: str, owner: str
+    ) -> MulticallBatcher:
+        """Build the Multicall3 batch for the staking params and pre-checks."""
+        self._patch()
+        ledger_api, _ = OnChainHelper.get_ledger_and_crypto_objects(
+            chain_type=self.chain_type
+        )
+        staking_ctr = t.cast(
+            ServiceStakingTokenContract,
+            ServiceStakingTokenContract.from_dir(
+                directory=str(DATA_DIR / "contracts" / "service_staking_token")
+            ),
+        )
+        staking_instance = staking_ctr.get_instance(
+            ledger_api=ledger_api,
+            contract_address=staking_contract,
+        )
+        token_instance = registry_contracts.erc20.get_instance(
+            ledger_api=ledger_api,
+            contract_address=token,
+        )
+        return (
+            MulticallBatcher(ledger_api=ledger_api)
+            .add(staking_instance, "getAgentIds")
+            .add(staking_instance, "serviceRegistry")
+            .add(staking_instance, "stakingToken")
+            .add(staking_instance, "serviceRegistryTokenUtility")
+            .add(staking_instance, "minStakingDeposit")
+            .add(staking_instance, "activityChecker")
+            .add(staking_instance, "maxNumServices")
+            .add(staking_instance, "getServiceIds")
+            .add(staking_instance, "availableRewards")
+            .add(token_instance, "balanceOf", [owner])
+        )
+
+    @staticmethod
+    def _parse_staking_precheck_batch(ledger_api: LedgerApi, results: t.List) -> t.Dict:
+        """Parse the staking params and pre-check batch results."""
+        (
+            agent_ids,
+            service_registry,
+            staking_token,
+            service_registry_token_utility,
+            min_staking_deposit,
+            activity_checker,
+            max_num_services,
+            service_ids,
+            available_rewards,
+            balance,
+        ) = results
+        to_checksum_address = ledger_api.api.to_checksum_address
+        return dict(
+            params=dict(
+                agent_ids=list(agent_ids),
+                service_registry=to_checksum_address(service_registry),
+                staking_token=to_checksum_address(staking_token),
+                service_registry_token_utility=to_checksum_address(
+                    service_registry_token_utility
+                ),
+                min_staking_deposit=min_staking_deposit,
+                activity_checker=to_checksum_address(activity_checker),
+            ),
+            slots_available=max_num_services - len(service_ids) > 0,
+            rewards_available=available_rewards > 0,
+            balance=balance,
+        )
+
+    async def a_staking_precheck(
+        self, staking_contract: str, token: str, owner: str
+    ) -> t.Dict:
+        """
+        Read the staking params, slots, rewards and balance in one call
+
+        :param staking_contract: Staking contract address.
+        :param token: Token to read the balance of, the staking token.
+        :param owner: Address to read the token balance of.
+        :return: Dictionary with the `get_staking_params` output as `params`,
+            `slots_available`, `rewards_available` and `balance`.
+        """
+        batch = self._staking_precheck_batch(
+            staking_contract=staking_contract,
+            token=token,
+            owner=owner,
+        )
+        return self._parse_staking_precheck_batch(
+            ledger_api=batch.ledger_api,
+            results=await batch.a_call(rpc=self.rpc),
+        )
+
     def get_service_safe_owners(self, service_id: int) -> t.List[str]:
         """Get list of owners."""
         ledger_api, _ = OnChainHelper.get_ledger_and_crypto_objects(
@@ -60,6 +60,7 @@ from operate.constants import (
     DEPLOYMENT_JSON,
     DOCKER_COMPOSE_YAML,
     KEYS_JSON,
+    STATE_JSON,
 )
 from operate.http.exceptions import NotAllowed
 from operate.keys import Keys
@@ -655,6 +656,7 @@ class Service(LocalResource):
 
     _helper: t.Optional[ServiceHelper] = None
     _deployment: t.Optional[Deployment] = None
+    _dirty: bool = False
 
     _file = "config.json"
 
@@ -727,7 +729,53 @@ class Service(LocalResource):
     def load(cls, path: Path) -> "Service":
         """Load a service"""
         cls.migrate_format(path)
-        return super().load(path)  # type: ignore
+        service = t.cast(Service, super().load(path))
+        service._apply_state()
+        return service
+
+    @property
+    def dirty(self) -> bool:
+        """Whether there are changes not written to the config file yet."""
+        return self._dirty
+
+    def store_state_only(self) -> None:
+        """
+        Persist the on-chain token and state of each chain to `state.json`
+
+        This is a lightweight checkpoint for multi-step flows, the full config
+        is written with `store` once the flow finishes.
+        """
+        state = {
+            chain_id: {
+                "token": chain_config.chain_data.token,
+                "on_chain_state": chain_config.chain_data.on_chain_state.value,
+            }
+            for chain_id, chain_config in self.chain_configs.items()
+        }
+        tmp_file = self.path / f"{STATE_JSON}.tmp"
+        tmp_file.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        os.replace(tmp_file, self.path / STATE_JSON)
+        self._dirty = True
+
+    def _apply_state(self) -> None:
+        """Apply a checkpoint left by `store_state_only`."""
+        state_file = self.path / STATE_JSON
+        if not state_file.exists():
+            return
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+        for chain_id, chain_state in state.items():
+            if chain_id not in self.chain_configs:
+                continue
+            chain_data = self.chain_configs[chain_id].chain_data
+            chain_data.token = chain_state["token"]
+            chain_data.on_chain_state = OnChainState(chain_state["on_chain_state"])
+        self._dirty = True
+
+    def store(self) -> None:
+        """Store the service and drop the `state.json` checkpoint."""
+        super().store()
+        (self.path / STATE_JSON).unlink(missing_ok=True)
+        self._dirty = False
 
     @property
     def helper(self) -> ServiceHelper:
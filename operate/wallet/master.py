@@ -37,7 +37,8 @@ from operate.constants import (
     ON_CHAIN_INTERACT_SLEEP,
     ON_CHAIN_INTERACT_TIMEOUT,
 )
-from operate.ledger import get_default_rpc
+from operate.ledger import get_default_rpc, get_rpc_provider
+from operate.ledger.rpc import send_raw_transactions, wait_for_receipts
 from operate.resource import LocalResource
 from operate.types import ChainType, LedgerType
 from operate.utils.gnosis import add_owner
@@ -89,11 +90,15 @@ class MasterWallet(LocalResource):
         rpc: t.Optional[str] = None,
     ) -> LedgerApi:
         """Get ledger api object."""
-        return make_ledger_api(
+        rpc = rpc or get_default_rpc(chain=chain_type)
+        ledger_api = make_ledger_api(
             self.ledger_type.name.lower(),
-            address=(rpc or get_default_rpc(chain=chain_type)),
+            address=rpc,
             chain_id=chain_type.id,
         )
+        # The default RPCs fail over to their fallbacks
+        ledger_api.api.provider = get_rpc_provider(rpc=rpc, chain=chain_type)
+        return ledger_api
 
     def transfer(
         self,
@@ -106,6 +111,15 @@ class MasterWallet(LocalResource):
         """Transfer funds to the given account."""
         raise NotImplementedError()
 
+    def transfer_many(
+        self,
+        transfers: t.List[t.Tuple[str, int]],
+        chain_type: ChainType,
+        rpc: t.Optional[str] = None,
+    ) -> None:
+        """Transfer funds to many accounts at once."""
+        raise NotImplementedError()
+
     # pylint: disable=too-many-arguments
     def transfer_erc20(
         self,
@@ -178,6 +192,34 @@ class EthereumMasterWallet(MasterWallet):
     _key = ledger_type.key_file
     _crypto_cls = EthereumCrypto
 
+    def _get_transfer_tx(
+        self,
+        ledger_api: EthereumApi,
+        to: str,
+        amount: int,
+        chain_type: ChainType,
+    ) -> t.Dict:
+        """Build a transfer transaction from the EOA wallet."""
+        max_priority_fee_per_gas = os.getenv("MAX_PRIORITY_FEE_PER_GAS", None)
+        max_fee_per_gas = os.getenv("MAX_FEE_PER_GAS", None)
+        tx = ledger_api.get_transfer_transaction(
+            sender_address=self.crypto.address,
+            destination_address=to,
+            amount=amount,
+            tx_fee=50000,
+            tx_nonce="0x",
+            chain_id=chain_type.id,
+            raise_on_try=True,
+            max_fee_per_gas=int(max_fee_per_gas) if max_fee_per_gas else None,
+            max_priority_fee_per_gas=int(max_priority_fee_per_gas)
+            if max_priority_fee_per_gas
+            else None,
+        )
+        return ledger_api.update_with_gas_estimate(
+            transaction=tx,
+            raise_on_try=True,
+        )
+
     def _transfer_from_eoa(
         self, to: str, amount: int, chain_type: ChainType, rpc: t.Optional[str] = None
     ) -> None:
@@ -198,29 +240,74 @@ class EthereumMasterWallet(MasterWallet):
             *args: t.Any, **kwargs: t.Any
         ) -> t.Dict:
             """Build transaction"""
-            max_priority_fee_per_gas = os.getenv("MAX_PRIORITY_FEE_PER_GAS", None)
-            max_fee_per_gas = os.getenv("MAX_FEE_PER_GAS", None)
-            tx = ledger_api.get_transfer_transaction(
-                sender_address=self.crypto.address,
-                destination_address=to,
+            return self._get_transfer_tx(
+                ledger_api=ledger_api,
+                to=to,
                 amount=amount,
-                tx_fee=50000,
-                tx_nonce="0x",
-                chain_id=chain_type.id,
-                raise_on_try=True,
-                max_fee_per_gas=int(max_fee_per_gas) if max_fee_per_gas else None,
-                max_priority_fee_per_gas=int(max_priority_fee_per_gas)
-                if max_priority_fee_per_gas
-                else None,
-            )
-            return ledger_api.update_with_gas_estimate(
-                transaction=tx,
-                raise_on_try=True,
+                chain_type=chain_type,
             )
 
         setattr(tx_helper, "build", _build_tx)  # noqa: B010
         tx_helper.transact(lambda x: x, "", kwargs={})
 
+    def transfer_many(
+        self,
+        transfers: t.List[t.Tuple[str, int]],
+        chain_type: ChainType,
+        rpc: t.Optional[str] = None,
+    ) -> None:
+        """
+        Transfer funds from the EOA wallet to many accounts at once
+
+        The transfers are signed with consecutive nonces and submitted without
+        waiting for each other. Transfers which cannot be built, are rejected by
+        the endpoint or revert are retried one by one with `_transfer_from_eoa`
+        once the submitted ones are mined. A submitted transfer is never
+        retried before its receipt shows it reverted.
+        """
+        if not transfers:
+            return
+
+        rpc = rpc or get_default_rpc(chain=chain_type)
+        ledger_api = t.cast(
+            EthereumApi, self.ledger_api(chain_type=chain_type, rpc=rpc)
+        )
+        nonce = ledger_api.api.eth.get_transaction_count(self.crypto.address, "pending")
+        raw_transactions: t.List[str] = []
+        for to, amount in transfers:
+            try:
+                tx = self._get_transfer_tx(
+                    ledger_api=ledger_api,
+                    to=to,
+                    amount=amount,
+                    chain_type=chain_type,
+                )
+            except Exception:  # pylint: disable=broad-except
+                # The remaining transfers are retried below
+                break
+            tx["nonce"] = nonce + len(raw_transactions)
+            signed_tx = Account.sign_transaction(tx, self.crypto.private_key)
+            raw_transactions.append(signed_tx.rawTransaction.hex())
+
+        tx_hashes, _ = send_raw_transactions(
+            rpc=rpc,
+            raw_transactions=raw_transactions,
+        )
+        receipts = wait_for_receipts(rpc=rpc, tx_hashes=tx_hashes) if tx_hashes else []
+        failed = [
+            transfer
+            for transfer, receipt in zip(transfers, receipts)
+            if int(receipt["status"], 16) != 1
+        ]
+        # `TxSettler` refreshes the gas and the nonce on every attempt
+        for to, amount in failed + transfers[len(receipts) :]:
+            self._transfer_from_eoa(
+                to=to,
+                amount=amount,
+                chain_type=chain_type,
+                rpc=rpc,
+            )
+
     def _transfer_from_safe(
         self, to: str, amount: int, chain_type: ChainType, rpc: t.Optional[str] = None
     ) -> None:
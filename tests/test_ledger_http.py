@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the RPC load balancer."""
+
+import math
+import threading
+from unittest import mock
+
+import pytest
+import requests
+
+from operate.ledger.http import RPCLoadBalancer, RPCStrategy
+
+
+ENDPOINTS = ["http://a", "http://b", "http://c"]
+
+
+def _balancer(strategy: RPCStrategy) -> RPCLoadBalancer:
+    """Build a balancer with mocked providers which do not ping."""
+    balancer = RPCLoadBalancer(endpoints=ENDPOINTS, strategy=strategy)
+    balancer.providers = [mock.Mock() for _ in ENDPOINTS]
+    for endpoint, provider in zip(ENDPOINTS, balancer.providers):
+        provider.make_request.return_value = {"result": endpoint}
+    balancer._ping_due = mock.Mock(return_value=False)  # type: ignore
+    return balancer
+
+
+class TestRPCLoadBalancer:
+    """Tests for `RPCLoadBalancer`."""
+
+    def test_round_robin(self) -> None:
+        """Requests rotate over the endpoints."""
+        balancer = _balancer(strategy=RPCStrategy.ROUND_ROBIN)
+        results = [
+            balancer.make_request("eth_blockNumber", [])["result"] for _ in range(4)
+        ]
+        assert results == ENDPOINTS + ENDPOINTS[:1]
+
+    def test_fastest(self) -> None:
+        """Requests go to the endpoint with the lowest latency."""
+        balancer = _balancer(strategy=RPCStrategy.FASTEST)
+        balancer._latencies = [0.3, 0.1, 0.2]
+        assert balancer.make_request("eth_blockNumber", [])["result"] == "http://b"
+
+    @pytest.mark.parametrize(
+        "method", ["eth_getTransactionCount", "eth_sendRawTransaction"]
+    )
+    def test_nonce_methods_use_failover_order(self, method: str) -> None:
+        """Nonce reads and submissions stick to the preferred endpoint."""
+        balancer = _balancer(strategy=RPCStrategy.FASTEST)
+        balancer._latencies = [0.3, 0.1, 0.2]
+        assert balancer.make_request(method, [])["result"] == "http://a"
+
+    def test_failover(self) -> None:
+        """A failing endpoint is skipped and tried last afterwards."""
+        balancer = _balancer(strategy=RPCStrategy.FAILOVER)
+        balancer.providers[0].make_request.side_effect = requests.ConnectionError()
+        assert balancer.make_request("eth_blockNumber", [])["result"] == "http://b"
+        assert balancer._latencies[0] == math.inf
+        assert balancer._order() == [1, 2, 0]
+
+    def test_all_failing(self) -> None:
+        """The last error is raised when every endpoint fails."""
+        balancer = _balancer(strategy=RPCStrategy.FAILOVER)
+        for provider in balancer.providers:
+            provider.make_request.side_effect = requests.ConnectionError()
+        with pytest.raises(requests.ConnectionError):
+            balancer.make_request("eth_blockNumber", [])
+
+    def test_json_rpc_errors_are_returned(self) -> None:
+        """JSON-RPC errors do not fail over."""
+        balancer = _balancer(strategy=RPCStrategy.FAILOVER)
+        balancer.providers[0].make_request.return_value = {"error": "reverted"}
+        assert balancer.make_request("eth_call", []) == {"error": "reverted"}
+        balancer.providers[1].make_request.assert_not_called()
+
+    def test_ping_in_background(self) -> None:
+        """Requests do not wait for the ping and use the current order."""
+        balancer = RPCLoadBalancer(endpoints=ENDPOINTS)
+        balancer._latencies = [0.3, 0.1, 0.2]
+        started, release = threading.Event(), threading.Event()
+
+        def _ping() -> None:
+            started.set()
+            release.wait(timeout=5)
+
+        with mock.patch.object(balancer, "_ping", side_effect=_ping) as ping:
+            assert balancer._order() == [1, 2, 0]
+            assert started.wait(timeout=5)
+            # A ping is already running
+            assert balancer._order() == [1, 2, 0]
+            release.set()
+        assert ping.call_count == 1
+
+    def test_ping(self) -> None:
+        """Every endpoint is measured, unreachable ones are marked failing."""
+        balancer = RPCLoadBalancer(endpoints=ENDPOINTS)
+        balancer._ping_providers = [mock.Mock() for _ in ENDPOINTS]
+        balancer._ping_providers[0].make_request.side_effect = requests.Timeout()
+        balancer._ping_providers[1].make_request.return_value = {"error": "down"}
+        balancer._ping_providers[2].make_request.return_value = {"result": "0x1"}
+        balancer._latencies = [0.0, 0.0, math.inf]
+        balancer._ping()
+        assert balancer._latencies[:2] == [math.inf, math.inf]
+        assert balancer._latencies[2] < math.inf
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the Multicall3 batcher."""
+
+import asyncio
+import typing as t
+from unittest import mock
+
+import pytest
+from web3 import Web3
+
+from operate.ledger import multicall
+from operate.ledger.multicall import MulticallBatcher
+
+
+TARGET = "0x000000000000000000000000000000000000dEaD"
+OWNER = "0x1111111111111111111111111111111111111111"
+
+ABI = [
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "stateMutability": "view",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "getIds",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256[]"}],
+    },
+    {
+        "type": "function",
+        "name": "getInfo",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [
+            {
+                "name": "",
+                "type": "tuple",
+                "components": [
+                    {"name": "id", "type": "uint256"},
+                    {"name": "owner", "type": "address"},
+                ],
+            },
+            {"name": "", "type": "bool"},
+        ],
+    },
+]
+
+
+@pytest.fixture(name="web3")
+def fixture_web3() -> Web3:
+    """Web3 object without a provider, only the codec is used."""
+    return Web3()
+
+
+def _batcher(web3: Web3) -> MulticallBatcher:
+    """Batcher with one call of each output shape."""
+    contract = web3.eth.contract(address=TARGET, abi=ABI)
+    return (
+        MulticallBatcher(ledger_api=mock.Mock(api=web3))
+        .add(contract, "balanceOf", [OWNER])
+        .add(contract, "getIds")
+        .add(contract, "getInfo")
+    )
+
+
+def _results(web3: Web3) -> t.List[t.Tuple[bool, bytes]]:
+    """Encoded `tryAggregate` results for `_batcher`."""
+    return [
+        (True, web3.codec.encode(["uint256"], [42])),
+        (True, web3.codec.encode(["uint256[]"], [[1, 2, 3]])),
+        (True, web3.codec.encode(["(uint256,address)", "bool"], [(7, OWNER), True])),
+    ]
+
+
+class TestMulticallBatcher:
+    """Tests for `MulticallBatcher`."""
+
+    def test_add(self, web3: Web3) -> None:
+        """Calls are queued with their calldata and collapsed output types."""
+        batcher = _batcher(web3=web3)
+        contract = web3.eth.contract(address=TARGET, abi=ABI)
+        target, calldata, output_types, fn_name = batcher._calls[0]
+        assert target == TARGET
+        assert fn_name == "balanceOf"
+        assert calldata.hex() == contract.encodeABI(fn_name="balanceOf", args=[OWNER])
+        assert batcher._calls[2][2] == ["(uint256,address)", "bool"]
+
+    def test_call(self, web3: Web3) -> None:
+        """Single outputs are unwrapped, multiple outputs become tuples."""
+        batcher = _batcher(web3=web3)
+        instance = mock.Mock()
+        instance.functions.tryAggregate.return_value.call.return_value = _results(
+            web3=web3
+        )
+        with mock.patch.object(
+            MulticallBatcher, "_instance", new_callable=mock.PropertyMock
+        ) as _instance:
+            _instance.return_value = instance
+            results = batcher.call()
+
+        assert results == [42, (1, 2, 3), ((7, OWNER), True)]
+        require_success, calls = instance.functions.tryAggregate.call_args.args
+        assert require_success is False
+        assert [target for target, _ in calls] == [TARGET] * 3
+
+    def test_call_reverted(self, web3: Web3) -> None:
+        """A reverted call raises unless failures are allowed."""
+        batcher = _batcher(web3=web3)
+        results = _results(web3=web3)
+        results[1] = (False, b"")
+        instance = mock.Mock()
+        instance.functions.tryAggregate.return_value.call.return_value = results
+        with mock.patch.object(
+            MulticallBatcher, "_instance", new_callable=mock.PropertyMock
+        ) as _instance:
+            _instance.return_value = instance
+            with pytest.raises(ValueError, match="Multicall to `getIds`"):
+                batcher.call()
+            assert batcher.call(allow_failure=True)[1] is None
+
+    def test_no_calls(self, web3: Web3) -> None:
+        """An empty batch does not call the chain."""
+        assert MulticallBatcher(ledger_api=mock.Mock(api=web3)).call() == []
+
+    def test_a_call(self, web3: Web3) -> None:
+        """The async call decodes the raw `eth_call` result."""
+        batcher = _batcher(web3=web3)
+        raw = web3.codec.encode(["(bool,bytes)[]"], [_results(web3=web3)])
+        with mock.patch.object(
+            multicall, "a_request", new=mock.AsyncMock(return_value="0x" + raw.hex())
+        ) as a_request:
+            results = asyncio.run(batcher.a_call(rpc="http://rpc"))
+
+        assert results == [42, (1, 2, 3), ((7, OWNER), True)]
+        (call,) = a_request.await_args_list
+        assert call.kwargs["method"] == "eth_call"
+        assert call.kwargs["params"][0]["to"] == multicall.MULTICALL3_ADDRESS
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the JSON-RPC batch helpers."""
+
+import asyncio
+import typing as t
+from unittest import mock
+
+import pytest
+import requests
+from eth_utils import keccak
+
+from operate.ledger import rpc
+
+
+def _response(body: t.Any) -> mock.Mock:
+    """Mock a `requests` response."""
+    response = mock.Mock()
+    response.json.return_value = body
+    return response
+
+
+class TestResults:
+    """Tests for `_results`."""
+
+    def test_matches_ids(self) -> None:
+        """Responses are matched by id, not by position."""
+        responses = [
+            {"jsonrpc": "2.0", "id": 7, "result": "b"},
+            {"jsonrpc": "2.0", "id": 5, "result": "a"},
+            {"jsonrpc": "2.0", "id": 6, "result": None},
+        ]
+        assert rpc._results(responses=responses, ids=[5, 6, 7]) == ["a", None, "b"]
+
+    def test_missing_response(self) -> None:
+        """A missing response raises."""
+        with pytest.raises(ValueError, match="Missing JSON-RPC response for request 1"):
+            rpc._results(responses=[{"id": 0, "result": "a"}], ids=[0, 1])
+
+    def test_error_response(self) -> None:
+        """An error response raises."""
+        responses = [{"id": 0, "error": {"code": -32000, "message": "reverted"}}]
+        with pytest.raises(ValueError, match="JSON-RPC request 0 failed"):
+            rpc._results(responses=responses, ids=[0])
+
+    def test_not_a_batch(self) -> None:
+        """A non batch response raises."""
+        with pytest.raises(ValueError, match="Invalid JSON-RPC batch response"):
+            rpc._results(responses={"error": "rate limited"}, ids=[0])
+
+
+class TestBatchRequest:
+    """Tests for `batch_request`."""
+
+    def test_chunks_with_offsets(self) -> None:
+        """Calls are chunked and ids keep counting across the chunks."""
+        payloads = []
+
+        def _post(url: str, json: t.List[t.Dict], timeout: float) -> mock.Mock:
+            payloads.append(json)
+            # Answer out of order, the results must still line up
+            return _response(
+                [
+                    {"jsonrpc": "2.0", "id": call["id"], "result": call["params"][0]}
+                    for call in reversed(json)
+                ]
+            )
+
+        calls = [("eth_getBalance", [f"0x{idx}", "latest"]) for idx in range(5)]
+        with mock.patch.object(rpc.HTTP_SESSION, "post", side_effect=_post):
+            results = rpc.batch_request(rpc="http://rpc", calls=calls, batch_size=2)
+
+        assert results == [f"0x{idx}" for idx in range(5)]
+        assert [[call["id"] for call in payload] for payload in payloads] == [
+            [0, 1],
+            [2, 3],
+            [4],
+        ]
+
+    def test_no_calls(self) -> None:
+        """No request is sent for an empty call list."""
+        with mock.patch.object(rpc.HTTP_SESSION, "post") as post:
+            assert rpc.batch_request(rpc="http://rpc", calls=[]) == []
+        post.assert_not_called()
+
+    def test_not_a_batch_fallback(self) -> None:
+        """Calls are retried one by one when batches are not supported."""
+        payloads = []
+
+        def _post(url: str, json: t.Any, timeout: float) -> mock.Mock:
+            payloads.append(json)
+            if isinstance(json, list):
+                return _response({"error": "batch requests are not supported"})
+            return _response(
+                {"jsonrpc": "2.0", "id": json["id"], "result": json["params"][0]}
+            )
+
+        calls = [("eth_getBalance", [f"0x{idx}", "latest"]) for idx in range(3)]
+        with mock.patch.object(rpc.HTTP_SESSION, "post", side_effect=_post):
+            results = rpc.batch_request(rpc="http://rpc", calls=calls, batch_size=2)
+
+        assert results == ["0x0", "0x1", "0x2"]
+        assert [isinstance(payload, list) for payload in payloads] == [
+            True,
+            False,
+            False,
+            True,
+            False,
+        ]
+
+    def test_a_not_a_batch_fallback(self) -> None:
+        """The async version falls back to single calls too."""
+
+        async def _a_post(session: t.Any, rpc: str, payload: t.Any) -> t.Any:
+            if isinstance(payload, list):
+                return {"error": "batch requests are not supported"}
+            return {
+                "jsonrpc": "2.0",
+                "id": payload["id"],
+                "result": payload["params"][0],
+            }
+
+        calls = [("eth_getBalance", [f"0x{idx}", "latest"]) for idx in range(3)]
+        with mock.patch.object(rpc, "_a_post", side_effect=_a_post):
+            results = asyncio.run(
+                rpc.a_batch_request(rpc="http://rpc", calls=calls, session=mock.Mock())
+            )
+
+        assert results == ["0x0", "0x1", "0x2"]
+
+
+RAW_TXS = ["0x01", "0x02", "0x03"]
+TX_HASHES = ["0x" + keccak(hexstr=raw_tx).hex() for raw_tx in RAW_TXS]
+
+
+def _rejected(method: str) -> rpc.RPCError:
+    """Mock a JSON-RPC rejection."""
+    return rpc.RPCError(f"JSON-RPC request 0 failed: {method}")
+
+
+class TestSendRawTransactions:
+    """Tests for `send_raw_transactions`."""
+
+    def test_all_accepted(self) -> None:
+        """The local hashes are returned."""
+        with mock.patch.object(rpc, "request", return_value="0xignored"):
+            assert rpc.send_raw_transactions(
+                rpc="http://rpc", raw_transactions=RAW_TXS
+            ) == (TX_HASHES, None)
+
+    def test_rejected(self) -> None:
+        """A rejected transaction unknown to the endpoint stops the submission."""
+        error = _rejected("eth_sendRawTransaction")
+
+        def _request(rpc: str, method: str, params: t.List) -> t.Any:
+            if method == "eth_getTransactionByHash":
+                return None
+            if params == [RAW_TXS[1]]:
+                raise error
+            return "0x"
+
+        with mock.patch.object(rpc, "request", side_effect=_request):
+            assert rpc.send_raw_transactions(
+                rpc="http://rpc", raw_transactions=RAW_TXS
+            ) == (TX_HASHES[:1], error)
+
+    def test_transport_error_known(self) -> None:
+        """A transaction the endpoint knows counts as submitted."""
+
+        def _request(rpc: str, method: str, params: t.List) -> t.Any:
+            if method == "eth_getTransactionByHash":
+                return {"hash": params[0]}
+            if params == [RAW_TXS[1]]:
+                raise requests.ReadTimeout()
+            return "0x"
+
+        with mock.patch.object(rpc, "request", side_effect=_request):
+            assert rpc.send_raw_transactions(
+                rpc="http://rpc", raw_transactions=RAW_TXS
+            ) == (TX_HASHES, None)
+
+    def test_transport_error_unknown(self) -> None:
+        """A transaction whose fate is unclear is left to its receipt."""
+        error = requests.ReadTimeout()
+
+        def _request(rpc: str, method: str, params: t.List) -> t.Any:
+            if method == "eth_getTransactionByHash":
+                raise requests.ConnectionError()
+            if params == [RAW_TXS[1]]:
+                raise error
+            return "0x"
+
+        with mock.patch.object(rpc, "request", side_effect=_request):
+            assert rpc.send_raw_transactions(
+                rpc="http://rpc", raw_transactions=RAW_TXS
+            ) == (TX_HASHES[:2], error)
+
+
+class TestWaitForReceipts:
+    """Tests for `wait_for_receipts`."""
+
+    def test_backoff(self) -> None:
+        """Only pending transactions are polled and the interval grows."""
+        polls = [[None, None, {"status": 1}], [{"status": 1}, None], [{"status": 0}]]
+        with mock.patch.object(
+            rpc, "batch_request", side_effect=polls
+        ) as batch_request, mock.patch.object(rpc.time, "sleep") as sleep:
+            receipts = rpc.wait_for_receipts(
+                rpc="http://rpc",
+                tx_hashes=["0xa", "0xb", "0xc"],
+                sleep=1.0,
+                max_sleep=1.2,
+                factor=2.0,
+            )
+
+        assert receipts == [{"status": 1}, {"status": 0}, {"status": 1}]
+        assert [
+            [params[0] for _, params in call.kwargs["calls"]]
+            for call in batch_request.call_args_list
+        ] == [["0xa", "0xb", "0xc"], ["0xa", "0xb"], ["0xb"]]
+        assert [call.args[0] for call in sleep.call_args_list] == [1.0, 1.2]
+
+    def test_timeout(self) -> None:
+        """Waiting stops at the deadline."""
+        with mock.patch.object(
+            rpc, "batch_request", return_value=[None]
+        ), mock.patch.object(rpc.time, "sleep"), mock.patch.object(
+            rpc.time, "time", side_effect=[0.0, 1.0, 3.0]
+        ):
+            with pytest.raises(RuntimeError, match="Timeout"):
+                rpc.wait_for_receipts(
+                    rpc="http://rpc",
+                    tx_hashes=["0xa"],
+                    timeout=2.0,
+                )
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2024 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Tests for the service state checkpoints."""
+
+from pathlib import Path
+
+import pytest
+
+from operate.constants import STATE_JSON
+from operate.services.service import Service
+from operate.types import (
+    ChainConfig,
+    ChainType,
+    LedgerConfig,
+    LedgerType,
+    OnChainData,
+    OnChainFundRequirements,
+    OnChainState,
+    OnChainUserParams,
+)
+
+
+@pytest.fixture(name="service")
+def fixture_service(tmp_path: Path) -> Service:
+    """Stored service without an on-chain token."""
+    service = Service(
+        version=2,
+        hash="bafybeitest",
+        keys=[],
+        home_chain_id="100",
+        chain_configs={
+            "100": ChainConfig(
+                ledger_config=LedgerConfig(
+                    rpc="http://localhost:8545",
+                    type=LedgerType.ETHEREUM,
+                    chain=ChainType.GNOSIS,
+                ),
+                chain_data=OnChainData(
+                    instances=[],
+                    token=-1,
+                    multisig="0x0000000000000000000000000000000000000000",
+                    staked=False,
+                    on_chain_state=OnChainState.NON_EXISTENT,
+                    user_params=OnChainUserParams(
+                        staking_program_id="pearl_alpha",
+                        nft="bafybeinft",
+                        threshold=1,
+                        use_staking=False,
+                        cost_of_bond=1,
+                        fund_requirements=OnChainFundRequirements(agent=1, safe=1),
+                    ),
+                ),
+            )
+        },
+        path=tmp_path,
+        service_path=tmp_path / "service",
+    )
+    service.store()
+    return service
+
+
+class TestStateCheckpoint:
+    """Tests for `store_state_only` and `_apply_state`."""
+
+    def test_round_trip(self, service: Service) -> None:
+        """A checkpoint is applied on load without rewriting the config."""
+        config = (service.path / Service._file).read_text(encoding="utf-8")
+        chain_data = service.chain_configs["100"].chain_data
+        chain_data.token = 42
+        chain_data.on_chain_state = OnChainState.ACTIVE_REGISTRATION
+        service.store_state_only()
+
+        assert service.dirty
+        assert (service.path / STATE_JSON).exists()
+        assert (service.path / Service._file).read_text(encoding="utf-8") == config
+
+        loaded = Service.load(path=service.path)
+        loaded_chain_data = loaded.chain_configs["100"].chain_data
+        assert loaded_chain_data.token == 42
+        assert loaded_chain_data.on_chain_state == OnChainState.ACTIVE_REGISTRATION
+        assert loaded.dirty
+
+    def test_store_drops_checkpoint(self, service: Service) -> None:
+        """A full store persists the checkpointed state and drops the file."""
+        service.chain_configs["100"].chain_data.token = 42
+        service.store_state_only()
+        service.store()
+
+        assert not service.dirty
+        assert not (service.path / STATE_JSON).exists()
+        loaded = Service.load(path=service.path)
+        assert loaded.chain_configs["100"].chain_data.token == 42
+        assert not loaded.dirty
+
+    def test_unknown_chain(self, service: Service) -> None:
+        """Checkpointed chains missing from the config are ignored."""
+        service.store_state_only()
+        (service.path / STATE_JSON).write_text(
+            '{"1": {"token": 1, "on_chain_state": 4}}', encoding="utf-8"
+        )
+
+        loaded = Service.load(path=service.path)
+        assert loaded.chain_configs["100"].chain_data.token == -1